@@ -0,0 +1,181 @@
+"""
+가짜 Discord API(fake_discord.py)에 대해 관리자 명령어 흐름을 실행하고
+흐름별 API 호출 수, 소요 시간, 레이트 리밋 대기 시간을 보고합니다.
+
+    python bench/admin_flows.py --latency 0.08 --repeat 3
+
+실제 cog 코드(LotteryConfig/LotteryBoard)를 그대로 실행하며,
+상태 파일은 임시 디렉터리에 만들어지므로 config/, data/는 건드리지 않습니다.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import types
+
+import discord
+from discord.ext import commands
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import lottery_store  # noqa: E402
+from fake_discord import FakeDiscord  # noqa: E402
+
+
+class BenchBot(commands.Bot):
+    """게이트웨이 없이 REST만 사용하는 봇. get_channel은 미리 가져온 채널을 돌려줍니다."""
+
+    def __init__(self):
+        super().__init__(command_prefix="*", intents=discord.Intents.none(), help_command=None)
+        self.bench_channels = {}
+
+    def get_channel(self, channel_id):
+        return self.bench_channels.get(channel_id) or super().get_channel(channel_id)
+
+
+class RatelimitTimer:
+    """discord.py가 레이트 리밋 버킷에서 기다린 시간을 합산합니다.
+
+    요청 전 대기(acquire)와, 남은 요청이 0일 때 응답 후 미리 자는 시간(__aexit__)을 모두 셉니다.
+    웹훅 요청은 별도의 어댑터가 처리하므로 여기에 포함되지 않습니다.
+    """
+
+    def __init__(self):
+        self.total = 0.0
+        self._originals = {}
+
+    def _wrap(self, original):
+        timer = self
+
+        async def wrapper(ratelimit, *args):
+            start = time.perf_counter()
+            try:
+                return await original(ratelimit, *args)
+            finally:
+                timer.total += time.perf_counter() - start
+        return wrapper
+
+    def __enter__(self):
+        for name in ("acquire", "__aexit__"):
+            original = getattr(discord.http.Ratelimit, name)
+            self._originals[name] = original
+            setattr(discord.http.Ratelimit, name, self._wrap(original))
+        return self
+
+    def __exit__(self, *exc):
+        for name, original in self._originals.items():
+            setattr(discord.http.Ratelimit, name, original)
+
+
+async def send_alerts(bot, channel_ids, count):
+    """당첨 알림 count건을 큐에 넣고 LotteryBoard가 모두 보낼 때까지 기다립니다."""
+    board_cog = bot.get_cog("LotteryBoard")
+    state = board_cog.state
+    for i in range(count):
+        embed = discord.Embed(title="🎉 당첨!", description=f"벤치마크 알림 {i + 1}")
+        state["alerts"].append({"channel_ids": list(channel_ids), "content": None, "embed": embed})
+    state["alert_wakeup"].set()
+    await board_cog.drain(120)
+
+
+def use_temp_state(directory: str):
+    """lottery_store의 파일 경로를 임시 디렉터리로 바꿉니다."""
+    lottery_store.CONFIG_PATH = os.path.join(directory, "config", "lottery_config.json")
+    lottery_store.DATA_PATH = os.path.join(directory, "data", "lottery_data.json")
+    lottery_store.ARCHIVE_DIR = os.path.join(directory, "data", "lottery_archive")
+    lottery_store.LOCK_PATH = os.path.join(directory, "config", ".lottery.lock")
+
+
+def make_ctx(bot, channel, author):
+    """명령어 콜백에 넘길 최소한의 Context 대용 객체"""
+    return types.SimpleNamespace(bot=bot, guild=channel.guild, channel=channel, author=author, send=channel.send)
+
+
+async def run_flow(fake, name, coro_factory, results):
+    fake.reset_stats()
+    with RatelimitTimer() as timer:
+        start = time.perf_counter()
+        await coro_factory()
+        elapsed = time.perf_counter() - start
+    results.append({
+        "flow": name,
+        "calls": sum(fake.calls.values()),
+        "by_route": dict(fake.calls),
+        "wall": elapsed,
+        "ratelimit_wait": timer.total,
+        "http_429": fake.rate_limited,
+    })
+
+
+async def run(args):
+    fake = FakeDiscord(latency=args.latency, jitter=args.jitter)
+    base_url = await fake.start()
+    discord.http.Route.BASE = base_url
+
+    tmp = tempfile.mkdtemp(prefix="haryung-bench-")
+    use_temp_state(tmp)
+
+    bot = BenchBot()
+    results = []
+    try:
+        await bot.login("fake-token")
+        await bot.load_extension("cogs.LotteryBoard")
+        await bot.load_extension("cogs.LotteryConfig")
+        config_cog = bot.get_cog("LotteryConfig")
+
+        board_channel = await bot.fetch_channel(10)
+        info_channel = await bot.fetch_channel(11)
+        alert_channel = await bot.fetch_channel(12)
+        bot.bench_channels = {c.id: c for c in (board_channel, info_channel, alert_channel)}
+        board_ctx = make_ctx(bot, board_channel, bot.user)
+        info_ctx = make_ctx(bot, info_channel, bot.user)
+
+        for i in range(args.repeat):
+            suffix = f" #{i + 1}" if args.repeat > 1 else ""
+            await run_flow(fake, f"경품셔플{suffix}",
+                           lambda: config_cog.prize_shuffle.callback(config_cog, board_ctx), results)
+            await run_flow(fake, f"뽑기판생성{suffix}",
+                           lambda: config_cog.create_board.callback(config_cog, board_ctx), results)
+            await run_flow(fake, f"메시지생성{suffix}",
+                           lambda: config_cog.create_info_message.callback(config_cog, info_ctx), results)
+            await run_flow(fake, f"경품초기화{suffix}",
+                           lambda: config_cog.prize_reset.callback(config_cog, board_ctx), results)
+            await run_flow(fake, f"알림{args.alerts}건x2채널{suffix}",
+                           lambda: send_alerts(bot, (info_channel.id, alert_channel.id), args.alerts), results)
+    finally:
+        await bot.close()
+        await fake.stop()
+
+    print_report(results, args)
+
+
+def print_report(results, args):
+    print(f"\n📊 관리자 흐름 벤치마크 (지연 {args.latency * 1000:.0f}ms, 지터 {args.jitter * 1000:.0f}ms)\n")
+    header = f"{'흐름':<16}{'API 호출':>10}{'소요(초)':>12}{'RL 대기(초)':>14}{'429':>6}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['flow']:<16}{r['calls']:>10}{r['wall']:>12.3f}{r['ratelimit_wait']:>14.3f}{r['http_429']:>6}")
+    if args.verbose:
+        for r in results:
+            print(f"\n[{r['flow']}]")
+            for route, count in sorted(r["by_route"].items()):
+                print(f"  {count:>4}  {route}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="관리자 흐름 오프라인 벤치마크")
+    parser.add_argument("--latency", type=float, default=0.05, help="요청당 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    parser.add_argument("--repeat", type=int, default=1, help="흐름 반복 횟수")
+    parser.add_argument("--alerts", type=int, default=10, help="알림 흐름에서 보낼 알림 수")
+    parser.add_argument("-v", "--verbose", action="store_true", help="경로별 호출 수 출력")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+봇이 사용하는 Discord REST 엔드포인트를 흉내 내는 로컬 서버입니다.
+
+지연 시간과 경로별 레이트 리밋 버킷을 실제 Discord와 비슷한 헤더로 재현하므로,
+discord.py의 레이트 리밋 처리까지 포함해서 관리자 흐름을 오프라인으로 측정할 수 있습니다.
+REST 전용이며 게이트웨이는 흉내 내지 않으므로, main.py로 봇 전체를 띄울 수는 없습니다.
+bench/admin_flows.py처럼 로그인만 하고 cog 명령어 콜백을 직접 호출하는 용도로 사용합니다.
+
+단독 실행:
+    python bench/fake_discord.py --port 8765 --latency 0.08
+"""
+import argparse
+import asyncio
+import collections
+import datetime
+import hashlib
+import json
+import random
+import time
+
+from aiohttp import web
+
+API_PREFIX = "/api/v10"
+DISCORD_EPOCH = 1420070400000
+
+# (메서드, 경로) -> (요청 수, 초). 채널별로 버킷이 나뉩니다.
+ROUTE_LIMITS = {
+    ("POST", "/channels/{channel_id}/messages"): (5, 5.0),
+    ("PATCH", "/channels/{channel_id}/messages/{message_id}"): (5, 5.0),
+    ("DELETE", "/channels/{channel_id}/messages/{message_id}"): (5, 1.0),
+    ("GET", "/channels/{channel_id}/messages/{message_id}"): (5, 5.0),
+    ("POST", "/webhooks/{webhook_id}/{webhook_token}"): (5, 2.0),
+}
+DEFAULT_LIMIT = (10, 10.0)
+
+
+def json_response(body, status: int = 200, headers: dict = None) -> web.Response:
+    """discord.py는 Content-Type이 정확히 application/json일 때만 JSON으로 해석합니다."""
+    merged = {"Content-Type": "application/json"}
+    merged.update(headers or {})
+    return web.Response(body=json.dumps(body).encode(), status=status, headers=merged)
+
+
+class RouteBucket:
+    """고정 윈도우 방식의 레이트 리밋 버킷"""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.used = 0
+        self.reset_at = 0.0
+
+    def hit(self, now: float):
+        """요청 하나를 소비합니다. 한도를 넘었으면 남은 대기 시간을 반환합니다."""
+        if now >= self.reset_at:
+            self.used = 0
+            self.reset_at = now + self.window
+        if self.used >= self.limit:
+            return self.reset_at - now
+        self.used += 1
+        return None
+
+
+class FakeDiscord:
+    """메모리에 채널과 메시지를 보관하는 가짜 Discord API"""
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.0, guild_id: int = 1, channel_ids=(10, 11, 12)):
+        self.latency = latency
+        self.jitter = jitter
+        self.guild_id = guild_id
+        self.bot_user = {"id": str(self._snowflake()), "username": "haryung", "discriminator": "0",
+                         "avatar": None, "global_name": None, "bot": True}
+        self.channels = {cid: self._channel_payload(cid) for cid in channel_ids}
+        self.messages = {}
+        self.webhooks = {}
+        self.buckets = {}
+        self.reset_stats()
+
+    # --- 통계 ---
+
+    def reset_stats(self):
+        self.calls = collections.Counter()
+        self.rate_limited = 0
+        self.retry_after_total = 0.0
+
+    # --- 페이로드 ---
+
+    _counter = 0
+
+    def _snowflake(self) -> int:
+        FakeDiscord._counter = (FakeDiscord._counter + 1) % 4096
+        return ((int(time.time() * 1000) - DISCORD_EPOCH) << 22) | FakeDiscord._counter
+
+    def _channel_payload(self, channel_id: int) -> dict:
+        return {
+            "id": str(channel_id), "type": 0, "guild_id": str(self.guild_id), "name": f"bench-{channel_id}",
+            "position": 0, "permission_overwrites": [], "nsfw": False, "parent_id": None,
+            "topic": None, "rate_limit_per_user": 0, "last_message_id": None
+        }
+
+    def _message_payload(self, channel_id: int, body: dict, author: dict = None) -> dict:
+        now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        return {
+            "id": str(self._snowflake()), "channel_id": str(channel_id), "guild_id": str(self.guild_id),
+            "author": author or self.bot_user, "content": body.get("content") or "",
+            "timestamp": now, "edited_timestamp": None, "tts": False,
+            "mention_everyone": False, "mentions": [], "mention_roles": [], "attachments": [],
+            "embeds": body.get("embeds") or [], "components": body.get("components") or [],
+            "pinned": False, "type": 0, "flags": 0
+        }
+
+    # --- 미들웨어 ---
+
+    @web.middleware
+    async def middleware(self, request, handler):
+        resource = request.match_info.route.resource
+        template = resource.canonical[len(API_PREFIX):] if resource else request.path
+        route_key = (request.method, template)
+        self.calls[f"{request.method} {template}"] += 1
+
+        # 지연 시뮬레이션
+        await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+
+        limit, window = ROUTE_LIMITS.get(route_key, DEFAULT_LIMIT)
+        major = request.match_info.get("channel_id") or request.match_info.get("webhook_id") or ""
+        bucket_hash = hashlib.md5(f"{request.method} {template}".encode()).hexdigest()[:16]
+        bucket = self.buckets.setdefault((bucket_hash, major), RouteBucket(limit, window))
+
+        now = time.monotonic()
+        retry_after = bucket.hit(now)
+        headers = {
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Bucket": bucket_hash,
+            "Via": "1.1 fake-discord",
+        }
+        if retry_after is not None:
+            self.rate_limited += 1
+            self.retry_after_total += retry_after
+            headers.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": f"{retry_after:.3f}",
+                            "X-RateLimit-Scope": "user"})
+            body = {"message": "You are being rate limited.", "retry_after": round(retry_after, 3), "global": False}
+            return json_response(body, status=429, headers=headers)
+
+        response = await handler(request)
+        response.headers.update(headers)
+        response.headers["X-RateLimit-Remaining"] = str(bucket.limit - bucket.used)
+        response.headers["X-RateLimit-Reset-After"] = f"{bucket.reset_at - now:.3f}"
+        return response
+
+    # --- 핸들러 ---
+
+    async def _read_body(self, request) -> dict:
+        if request.content_type.startswith("multipart/"):
+            form = await request.post()
+            return json.loads(form.get("payload_json", "{}"))
+        if request.can_read_body:
+            return await request.json()
+        return {}
+
+    def _not_found(self, code: int, message: str):
+        return json_response({"message": message, "code": code}, status=404)
+
+    async def get_me(self, request):
+        return json_response(self.bot_user)
+
+    async def get_application(self, request):
+        return json_response({
+            "id": self.bot_user["id"], "name": "haryung", "description": "", "icon": None,
+            "bot_public": False, "bot_require_code_grant": False, "owner": self.bot_user,
+            "verify_key": "0" * 64, "flags": 0
+        })
+
+    async def get_channel(self, request):
+        channel = self.channels.get(int(request.match_info["channel_id"]))
+        if channel is None:
+            return self._not_found(10003, "Unknown Channel")
+        return json_response(channel)
+
+    async def create_message(self, request):
+        channel_id = int(request.match_info["channel_id"])
+        if channel_id not in self.channels:
+            return self._not_found(10003, "Unknown Channel")
+        message = self._message_payload(channel_id, await self._read_body(request))
+        self.messages[int(message["id"])] = message
+        return json_response(message)
+
+    async def get_message(self, request):
+        message = self.messages.get(int(request.match_info["message_id"]))
+        if message is None:
+            return self._not_found(10008, "Unknown Message")
+        return json_response(message)
+
+    async def edit_message(self, request):
+        message = self.messages.get(int(request.match_info["message_id"]))
+        if message is None:
+            return self._not_found(10008, "Unknown Message")
+        body = await self._read_body(request)
+        for key in ("content", "embeds", "components"):
+            if key in body:
+                message[key] = body[key]
+        message["edited_timestamp"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        return json_response(message)
+
+    async def get_channel_webhooks(self, request):
+        channel_id = int(request.match_info["channel_id"])
+        return json_response([w for w in self.webhooks.values() if w["channel_id"] == str(channel_id)])
+
+    async def create_webhook(self, request):
+        channel_id = int(request.match_info["channel_id"])
+        if channel_id not in self.channels:
+            return self._not_found(10003, "Unknown Channel")
+        body = await self._read_body(request)
+        webhook_id = self._snowflake()
+        webhook = {
+            "id": str(webhook_id), "type": 1, "channel_id": str(channel_id), "guild_id": str(self.guild_id),
+            "name": body.get("name"), "avatar": None, "token": f"token-{webhook_id}",
+            "user": self.bot_user, "application_id": self.bot_user["id"]
+        }
+        self.webhooks[webhook_id] = webhook
+        return json_response(webhook)
+
+    async def execute_webhook(self, request):
+        webhook = self.webhooks.get(int(request.match_info["webhook_id"]))
+        if webhook is None or webhook["token"] != request.match_info["webhook_token"]:
+            return self._not_found(10015, "Unknown Webhook")
+        body = await self._read_body(request)
+        author = {"id": webhook["id"], "username": body.get("username") or webhook["name"],
+                  "discriminator": "0000", "avatar": None, "bot": True}
+        message = self._message_payload(int(webhook["channel_id"]), body, author=author)
+        message["webhook_id"] = webhook["id"]
+        self.messages[int(message["id"])] = message
+        if request.query.get("wait") == "true":
+            return json_response(message)
+        return web.Response(status=204)
+
+    async def delete_message(self, request):
+        if self.messages.pop(int(request.match_info["message_id"]), None) is None:
+            return self._not_found(10008, "Unknown Message")
+        return web.Response(status=204)
+
+    def make_app(self) -> web.Application:
+        app = web.Application(middlewares=[self.middleware])
+        p = API_PREFIX
+        app.router.add_get(f"{p}/users/@me", self.get_me)
+        app.router.add_get(f"{p}/oauth2/applications/@me", self.get_application)
+        app.router.add_get(f"{p}/channels/{{channel_id}}", self.get_channel)
+        app.router.add_post(f"{p}/channels/{{channel_id}}/messages", self.create_message)
+        app.router.add_get(f"{p}/channels/{{channel_id}}/messages/{{message_id}}", self.get_message)
+        app.router.add_patch(f"{p}/channels/{{channel_id}}/messages/{{message_id}}", self.edit_message)
+        app.router.add_delete(f"{p}/channels/{{channel_id}}/messages/{{message_id}}", self.delete_message)
+        app.router.add_get(f"{p}/channels/{{channel_id}}/webhooks", self.get_channel_webhooks)
+        app.router.add_post(f"{p}/channels/{{channel_id}}/webhooks", self.create_webhook)
+        app.router.add_post(f"{p}/webhooks/{{webhook_id}}/{{webhook_token}}", self.execute_webhook)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """서버를 시작하고 API 기본 URL을 반환합니다."""
+        self._runner = web.AppRunner(self.make_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]
+        return f"http://{host}:{bound_port}{API_PREFIX}"
+
+    async def stop(self):
+        await self._runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 Discord REST API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05, help="요청당 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    args = parser.parse_args()
+
+    fake = FakeDiscord(latency=args.latency, jitter=args.jitter)
+    print(f"📡 가짜 Discord API: http://{args.host}:{args.port}{API_PREFIX}")
+    web.run_app(fake.make_app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""
+뽑기 상태 저장 방식의 규모별 비용을 측정합니다.
+
+가상의 유저/길드 데이터를 만들어 불러오기, 저장, 유저 한 명 수정, 뽑기 한 번, 전체 내보내기(스냅샷)를
+저장 형식별로 실행하고 (내보내기 파일도 그 형식으로 씀), 작업마다 소요 시간, 최대 메모리, 쓴 바이트 수를 표로 출력합니다.
+
+    python bench/storage_bench.py --sizes 10,1000,100000
+    python bench/storage_bench.py --sizes 1000000 --repeat 1 --json result.json
+
+형식:
+    json-indent2  현재 봇이 쓰는 방식 (lottery_store.load_data/save_data 그대로 사용)
+    json-compact  들여쓰기 없는 JSON
+    json-gzip     gzip으로 압축한 JSON (봇의 아카이브/스냅샷과 같은 방식)
+
+시간은 tracemalloc 없이 따로 측정하고, 메모리는 tracemalloc을 켠 별도 실행에서 측정합니다.
+상태 파일은 임시 디렉터리에 만들어지므로 config/, data/는 건드리지 않습니다.
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import lottery_store  # noqa: E402
+
+USERS_PER_GUILD = 1000
+MAX_GUILDS = 2000
+DRAWN_PER_GUILD = 50
+
+
+# --- 데이터 생성 ---
+
+def make_dataset(user_count: int, seed: int = 0):
+    """user_count명의 유저를 여러 길드에 나눠 담은 (config, data)를 만듭니다."""
+    rng = random.Random(seed)
+    guild_count = min(MAX_GUILDS, max(1, user_count // USERS_PER_GUILD))
+    config, data = {}, {}
+    today = "2026-10-19"
+
+    for g in range(guild_count):
+        guild_id = str(1396829213100605580 + g)
+        gc = lottery_store.new_guild_config()
+        gc["alert_routes"] = [{"channel_id": 1400000000000000000 + g, "filter": lottery_store.ALERT_ALL}]
+        event = gc["events"][lottery_store.DEFAULT_EVENT]
+        event["prizes"] = [{"name": "꽝", "count": 90}, {"name": "문화상품권", "count": 10}]
+        pool = ["꽝"] * 90 + ["문화상품권"] * 10
+        lottery_store.shuffle_prizes(event, pool)
+        event["shuffled"] = True
+        event["board_channel_id"] = 1410000000000000000 + g
+        event["board_message_ids"] = [1420000000000000000 + g * 10 + i for i in range(lottery_store.BOARD_COUNT)]
+        config[guild_id] = gc
+        data[guild_id] = {lottery_store.DEFAULT_EVENT: {}}
+
+    guild_ids = list(config)
+    for u in range(user_count):
+        guild_id = guild_ids[u % guild_count]
+        user_id = str(300000000000000000 + u)
+        draws = [{"number": rng.randint(1, 100), "prize": "꽝"} for _ in range(rng.choice((0, 0, 0, 1, 2, 3)))]
+        data[guild_id][lottery_store.DEFAULT_EVENT][user_id] = {
+            "tickets": rng.randint(0, 5),
+            "total_draws": len(draws),
+            "daily_claims": rng.randint(0, 1),
+            "last_claim_date": today,
+            "draws": draws,
+        }
+
+    # 길드마다 번호 절반은 이미 뽑힌 상태
+    for guild_id in guild_ids:
+        event = config[guild_id]["events"][lottery_store.DEFAULT_EVENT]
+        users = list(data[guild_id][lottery_store.DEFAULT_EVENT])
+        for number in rng.sample(range(1, 101), DRAWN_PER_GUILD):
+            event["drawn_numbers"][str(number)] = {
+                "user_id": rng.choice(users) if users else "0",
+                "prize": event["shuffled_prizes"][number - 1]
+            }
+    return config, data
+
+
+# --- 저장 형식 ---
+
+def _atomic_write(path: str, write):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+class CurrentFormat:
+    """현재 봇의 저장 방식 (lottery_store 함수를 그대로 호출)"""
+    name = "json-indent2"
+
+    def load_config(self):
+        return lottery_store.load_config()
+
+    def load_data(self):
+        return lottery_store.load_data()
+
+    def save_config(self, config):
+        lottery_store.save_config(config)
+
+    def save_data(self, data):
+        lottery_store.save_data(data)
+
+    def files(self):
+        return [lottery_store.CONFIG_PATH, lottery_store.DATA_PATH]
+
+    def export_path(self):
+        return os.path.join(lottery_store.SNAPSHOT_DIR, "bench-export.json")
+
+    def save_export(self, snapshot):
+        lottery_store._write_json(self.export_path(), snapshot)
+
+
+class CompactFormat(CurrentFormat):
+    name = "json-compact"
+    suffix = ".json"
+
+    def _path(self, path):
+        return path[:-len(".json")] + self.suffix
+
+    def _read(self, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write(self, path, obj):
+        def write(tmp_path):
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
+        _atomic_write(path, write)
+
+    def load_config(self):
+        return self._read(self._path(lottery_store.CONFIG_PATH))
+
+    def load_data(self):
+        return self._read(self._path(lottery_store.DATA_PATH))
+
+    def save_config(self, config):
+        self._write(self._path(lottery_store.CONFIG_PATH), config)
+
+    def save_data(self, data):
+        self._write(self._path(lottery_store.DATA_PATH), data)
+
+    def files(self):
+        return [self._path(lottery_store.CONFIG_PATH), self._path(lottery_store.DATA_PATH)]
+
+    def export_path(self):
+        return self._path(super().export_path())
+
+    def save_export(self, snapshot):
+        self._write(self.export_path(), snapshot)
+
+
+class GzipFormat(CompactFormat):
+    name = "json-gzip"
+    suffix = ".json.gz"
+
+    def _read(self, path):
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write(self, path, obj):
+        def write(tmp_path):
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
+        _atomic_write(path, write)
+
+
+FORMATS = [CurrentFormat(), CompactFormat(), GzipFormat()]
+
+
+# --- 작업 ---
+
+class Workload:
+    """한 형식에 대해 측정할 작업들. 각 작업은 쓴 파일 목록을 반환합니다."""
+
+    def __init__(self, fmt, config: dict, data: dict):
+        self.fmt = fmt
+        self.config = config
+        self.data = data
+        self.rng = random.Random(1)
+        self.guild_ids = list(config)
+
+    def load(self):
+        self.fmt.load_config()
+        self.fmt.load_data()
+        return []
+
+    def save(self):
+        self.fmt.save_config(self.config)
+        self.fmt.save_data(self.data)
+        return self.fmt.files()
+
+    def update(self):
+        """뽑기권 받기처럼 유저 한 명의 기록만 바꾸는 경우"""
+        guild_id = self.rng.choice(self.guild_ids)
+        with lottery_store.transaction():
+            data = self.fmt.load_data()
+            users = lottery_store.get_event_users(data, guild_id, lottery_store.DEFAULT_EVENT)
+            user_id = self.rng.choice(list(users)) if users else "0"
+            user = lottery_store.get_event_user(data, guild_id, lottery_store.DEFAULT_EVENT, user_id)
+            user["tickets"] += 1
+            user["daily_claims"] += 1
+            self.fmt.save_data(data)
+        return [self.fmt.files()[1]]
+
+    def draw(self):
+        """뽑기판 번호 버튼 하나를 눌렀을 때의 저장 작업"""
+        guild_id = self.rng.choice(self.guild_ids)
+        with lottery_store.transaction():
+            config = self.fmt.load_config()
+            data = self.fmt.load_data()
+            event = lottery_store.get_event(config, guild_id, lottery_store.DEFAULT_EVENT)
+            drawn = event["drawn_numbers"]
+            free = [n for n in range(1, lottery_store.TOTAL_NUMBERS + 1) if str(n) not in drawn]
+            if not free:
+                drawn.clear()
+                free = list(range(1, lottery_store.TOTAL_NUMBERS + 1))
+            number = self.rng.choice(free)
+            user_id = "bench-user"
+            user = lottery_store.get_event_user(data, guild_id, lottery_store.DEFAULT_EVENT, user_id)
+            user["total_draws"] += 1
+            prize = lottery_store.draw_prize(event, number)
+            lottery_store.record_user_draw(user, number, prize)
+            self.fmt.save_data(data)
+            drawn[str(number)] = {"user_id": user_id, "prize": prize}
+            self.fmt.save_config(config)
+        return self.fmt.files()
+
+    def export(self):
+        """모든 길드를 담은 전체 스냅샷 (재시작 후 첫 스냅샷과 같은 작업)
+
+        스냅샷도 측정 중인 형식으로 써서, 형식별 내보내기 비용을 비교할 수 있게 합니다.
+        """
+        with lottery_store.transaction():
+            config = self.fmt.load_config()
+            data = self.fmt.load_data()
+        guilds = {g: {"config": config.get(g), "data": data.get(g)} for g in set(config) | set(data)}
+        self.fmt.save_export({"taken_at": "", "guilds": guilds})
+        return [self.fmt.export_path()]
+
+
+OPERATIONS = ["load", "save", "update", "draw", "export"]
+
+
+def use_temp_state(directory: str):
+    """lottery_store의 파일 경로를 임시 디렉터리로 바꿉니다."""
+    lottery_store.CONFIG_PATH = os.path.join(directory, "config", "lottery_config.json")
+    lottery_store.DATA_PATH = os.path.join(directory, "data", "lottery_data.json")
+    lottery_store.SNAPSHOT_DIR = os.path.join(directory, "data", "lottery_snapshots")
+    lottery_store.LOCK_PATH = os.path.join(directory, "config", ".lottery.lock")
+
+
+def measure(func, repeat: int):
+    """(시간 중앙값(초), 최대 메모리(바이트), 쓴 바이트 수)를 반환합니다."""
+    times = []
+    written = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        paths = func()
+        times.append(time.perf_counter() - start)
+        written = sum(os.path.getsize(p) for p in paths)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times), peak, written
+
+
+def run_size(user_count: int, repeat: int, formats: list):
+    gen_start = time.perf_counter()
+    config, data = make_dataset(user_count)
+    gen_time = time.perf_counter() - gen_start
+    print(f"\n👥 유저 {user_count:,}명 / 길드 {len(config):,}개 (데이터 생성 {gen_time:.1f}초)", flush=True)
+
+    results = []
+    tmp = tempfile.mkdtemp(prefix="haryung-storage-")
+    try:
+        use_temp_state(tmp)
+        for fmt in formats:
+            workload = Workload(fmt, config, data)
+            workload.save()  # 불러오기 전에 파일을 만들어 둠
+            for op in OPERATIONS:
+                seconds, peak, written = measure(getattr(workload, op), repeat)
+                results.append({
+                    "users": user_count, "guilds": len(config), "format": fmt.name, "op": op,
+                    "seconds": seconds, "peak_bytes": peak, "bytes_written": written,
+                })
+                print(f"  {fmt.name:<14}{op:<8}{seconds * 1000:>12.1f}ms{peak / 2**20:>12.1f}MB{written / 2**20:>12.2f}MB",
+                      flush=True)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+
+def print_report(results: list):
+    print("\n📊 저장 형식별 비용 (시간은 중앙값, 메모리는 작업 중 최대 할당량)\n")
+    header = f"{'유저':>10}{'형식':>14}{'작업':>8}{'시간(ms)':>12}{'최대 메모리(MB)':>18}{'쓴 크기(MB)':>14}"
+    print(header)
+    print("-" * (len(header) + 8))
+    for r in results:
+        print(f"{r['users']:>10,}{r['format']:>14}{r['op']:>8}{r['seconds'] * 1000:>12.1f}"
+              f"{r['peak_bytes'] / 2**20:>18.1f}{r['bytes_written'] / 2**20:>14.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="뽑기 상태 저장 형식 규모별 벤치마크")
+    parser.add_argument("--sizes", default="10,1000,10000,100000",
+                        help="쉼표로 구분한 유저 수 목록 (최대 1000000 권장)")
+    parser.add_argument("--repeat", type=int, default=3, help="작업별 반복 횟수 (시간은 중앙값)")
+    parser.add_argument("--formats", default=",".join(f.name for f in FORMATS),
+                        help="측정할 형식 (쉼표 구분)")
+    parser.add_argument("--json", dest="json_path", help="결과를 JSON 파일로도 저장")
+    args = parser.parse_args()
+
+    names = args.formats.split(",")
+    formats = [f for f in FORMATS if f.name in names]
+    results = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        results.extend(run_size(size, args.repeat, formats))
+
+    print_report(results)
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
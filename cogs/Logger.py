@@ -53,9 +53,8 @@ class Logger(commands.Cog):
         if not self.log_channel_id:
             return
             
-        channel = self.bot.get_channel(self.log_channel_id)
-        if not channel:
-            return
+        # 로그 채널이 다른 샤드의 길드에 있으면 캐시에 없으므로 ID만으로 전송
+        channel = self.bot.get_channel(self.log_channel_id) or self.bot.get_partial_messageable(self.log_channel_id)
             
         # 파일명이 지정되지 않은 경우 호출한 파일의 이름을 가져옵니다
         if file_name is None:
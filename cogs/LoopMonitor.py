@@ -0,0 +1,192 @@
+import discord
+from discord.ext import commands
+import asyncio
+import collections
+import contextlib
+import io
+import sys
+import threading
+import time
+import traceback
+
+CHECK_INTERVAL = 0.25            # 이벤트 루프 지연 측정 주기 (초)
+LAG_THRESHOLD = 0.2              # 루프가 이 이상 멈추면 스택을 캡처 (초)
+SLOW_CALLBACK_THRESHOLD = 2.0    # 콜백/명령어가 이 이상 걸리면 기록 (초)
+REPORT_INTERVAL = 60             # Logger로 묶어서 보고하는 주기 (초)
+MAX_PENDING = 50                 # 보고 전까지 보관할 최대 기록 수
+STACK_DEPTH = 6                  # 캡처할 스택 프레임 수
+MESSAGE_LIMIT = 1800             # Logger 메시지 하나의 최대 길이
+
+
+class LoopMonitor(commands.Cog):
+    """이벤트 루프 지연 및 느린 콜백 감시"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.pending = collections.deque(maxlen=MAX_PENDING)
+        self.lag_samples = collections.deque(maxlen=int(REPORT_INTERVAL / CHECK_INTERVAL))
+        self.active = {}          # task -> (label, 시작 시각)
+        self._slow_stacks = {}    # task -> 임계값을 넘긴 시점의 스택
+        self.last_tick = time.monotonic()
+        self._loop_thread_id = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._tasks = []
+
+    async def cog_load(self):
+        self._loop_thread_id = threading.get_ident()
+        self.last_tick = time.monotonic()
+        self._tasks = [
+            asyncio.create_task(self._measure_lag()),
+            asyncio.create_task(self._report_loop()),
+        ]
+        # 루프가 멈춰 있는 동안에도 스택을 잡을 수 있도록 별도 스레드에서 감시
+        self._thread = threading.Thread(target=self._watchdog, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+        # 모든 명령어의 실행 시간 측정 (invoke 태스크 안에서 실행됨)
+        self.bot.before_invoke(self._before_command)
+        self.bot.after_invoke(self._after_command)
+
+        print(f"✅ {self.__class__.__name__} loaded successfully!")
+
+    async def cog_unload(self):
+        self._stop.set()
+        for task in self._tasks:
+            task.cancel()
+        if getattr(self.bot, "_before_invoke", None) == self._before_command:
+            self.bot._before_invoke = None
+        if getattr(self.bot, "_after_invoke", None) == self._after_command:
+            self.bot._after_invoke = None
+
+    # --- 측정 ---
+
+    async def _measure_lag(self):
+        """sleep이 예정보다 늦게 깨어난 만큼을 루프 지연으로 기록합니다."""
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            self.last_tick = time.monotonic()
+            await asyncio.sleep(CHECK_INTERVAL)
+            self.lag_samples.append(max(0.0, loop.time() - start - CHECK_INTERVAL))
+
+    def _watchdog(self):
+        """루프 스레드가 멈춰 있으면 그 시점의 스택과 실행 중인 콜백을 기록합니다."""
+        reported_tick = None
+        while not self._stop.wait(CHECK_INTERVAL):
+            tick = self.last_tick
+            stalled = time.monotonic() - tick - CHECK_INTERVAL
+            if stalled < LAG_THRESHOLD or tick == reported_tick:
+                continue
+            reported_tick = tick
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame, limit=STACK_DEPTH)) if frame else ""
+            try:
+                task = asyncio.current_task(self.bot.loop)
+            except RuntimeError:
+                task = None
+            label = self.active.get(task, ("알 수 없음", 0))[0]
+            self.pending.append({"kind": "차단", "label": label, "duration": stalled, "stack": stack})
+
+    def _start(self, label: str):
+        task = asyncio.current_task()
+        start = time.perf_counter()
+        self.active[task] = (label, start)
+        handle = asyncio.get_running_loop().call_later(SLOW_CALLBACK_THRESHOLD, self._capture_task_stack, task)
+        return task, label, start, handle
+
+    def _finish(self, token):
+        task, label, start, handle = token
+        handle.cancel()
+        self.active.pop(task, None)
+        stack = self._slow_stacks.pop(task, "")
+        duration = time.perf_counter() - start
+        if duration >= SLOW_CALLBACK_THRESHOLD:
+            self.pending.append({"kind": "느림", "label": label, "duration": duration, "stack": stack})
+
+    def _capture_task_stack(self, task):
+        """임계값을 넘긴 시점에 콜백이 어디서 기다리고 있는지 기록합니다."""
+        if task is None or task.done():
+            return
+        buf = io.StringIO()
+        task.print_stack(limit=STACK_DEPTH, file=buf)
+        self._slow_stacks[task] = buf.getvalue()
+
+    @contextlib.contextmanager
+    def track(self, label: str):
+        """with 블록의 실행 시간을 측정합니다."""
+        token = self._start(label)
+        try:
+            yield
+        finally:
+            self._finish(token)
+
+    async def _before_command(self, ctx):
+        ctx.monitor_token = self._start(f"*{ctx.command.qualified_name}")
+
+    async def _after_command(self, ctx):
+        token = getattr(ctx, "monitor_token", None)
+        if token:
+            self._finish(token)
+
+    # --- 보고 ---
+
+    def _lag_summary(self) -> str:
+        samples = list(self.lag_samples)
+        max_lag = max(samples, default=0.0)
+        avg_lag = sum(samples) / len(samples) if samples else 0.0
+        latency = self.bot.latency * 1000
+        return f"루프 지연 평균 {avg_lag * 1000:.1f}ms / 최대 {max_lag * 1000:.1f}ms, 하트비트 {latency:.0f}ms"
+
+    async def _report_loop(self):
+        while True:
+            await asyncio.sleep(REPORT_INTERVAL)
+            try:
+                await self.flush_report()
+            except Exception as e:
+                print(f"LoopMonitor 보고 중 오류 발생: {e}")
+
+    async def flush_report(self):
+        """쌓인 기록을 Logger로 묶어서 전송합니다."""
+        if not self.pending:
+            return
+        offenders = []
+        while self.pending:
+            offenders.append(self.pending.popleft())
+
+        chunks = [f"⏱️ 느린 작업 {len(offenders)}건 ({self._lag_summary()})"]
+        for o in offenders:
+            entry = f"\n• [{o['kind']}] `{o['label']}` {o['duration']:.2f}초"
+            if o["stack"]:
+                entry += f"\n```\n{o['stack'][-(MESSAGE_LIMIT // 2):]}```"
+            if len(chunks[-1]) + len(entry) > MESSAGE_LIMIT:
+                chunks.append(entry.lstrip("\n"))
+            else:
+                chunks[-1] += entry
+
+        logger = self.bot.get_cog('Logger')
+        for chunk in chunks:
+            if logger:
+                await logger.log(chunk, "LoopMonitor.py")
+            else:
+                print(chunk)
+
+    @commands.command(name='루프상태')
+    @commands.is_owner()
+    async def loop_status(self, ctx):
+        """현재 이벤트 루프 지연과 실행 중인 콜백을 표시합니다."""
+        now = time.perf_counter()
+        running = [f"`{label}` {now - start:.2f}초" for label, start in self.active.values()]
+        embed = discord.Embed(
+            title="⏱️ 이벤트 루프 상태",
+            description=self._lag_summary(),
+            color=discord.Color.blue()
+        )
+        embed.add_field(name="실행 중인 콜백", value="\n".join(running[:10]) or "없음", inline=False)
+        embed.add_field(name="보고 대기", value=f"{len(self.pending)}건", inline=False)
+        await ctx.send(embed=embed)
+
+
+async def setup(bot):
+    await bot.add_cog(LoopMonitor(bot))
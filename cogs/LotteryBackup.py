@@ -0,0 +1,235 @@
+import discord
+from discord.ext import commands
+import asyncio
+import datetime
+
+from lottery_store import (
+    SNAPSHOT_ID_FORMAT,
+    load_config, save_config, load_data, save_data, transaction,
+    guild_digest, write_snapshot, load_snapshot, delete_snapshot, list_snapshots, list_guild_snapshots,
+    find_guild_snapshot,
+)
+
+SNAPSHOT_INTERVAL = 600     # 자동 스냅샷 주기 (초)
+KEEP_ALL_HOURS = 24         # 이 시간 안의 스냅샷은 모두 보관
+KEEP_DAILY_DAYS = 7         # 그 이전은 하루에 하나씩 이 기간까지 보관
+LIST_LIMIT = 15             # 목록에 표시할 최대 스냅샷 수
+
+
+def _parse_snapshot_id(snapshot_id: str) -> datetime.datetime:
+    return datetime.datetime.strptime(snapshot_id[:15], SNAPSHOT_ID_FORMAT)
+
+
+class LotteryBackup(commands.Cog):
+    """뽑기 상태 스냅샷 및 복원"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.digests = {}   # guild_id -> 마지막 스냅샷에 기록된 상태의 해시
+        self._task = None
+        self._lock = asyncio.Lock()
+
+    async def cog_load(self):
+        # 재시작 직후 첫 스냅샷도 바뀐 길드만 남기도록 기존 스냅샷에서 해시를 복원
+        async with self._lock:
+            self.digests = await asyncio.to_thread(self._load_digests)
+        # 여러 프로세스로 샤딩한 경우 0번 샤드를 맡은 프로세스만 스냅샷을 찍음
+        shard_ids = getattr(self.bot, "shard_ids", None)
+        if shard_ids is None or 0 in shard_ids:
+            self._task = asyncio.create_task(self._snapshot_loop())
+        print(f"✅ {self.__class__.__name__} loaded successfully!")
+
+    async def cog_unload(self):
+        if self._task:
+            self._task.cancel()
+
+    # --- 스냅샷 ---
+
+    async def _snapshot_loop(self):
+        while True:
+            try:
+                await self.take_snapshot()
+                async with self._lock:
+                    await asyncio.to_thread(self._prune)
+            except Exception as e:
+                print(f"스냅샷 생성 중 오류 발생: {e}")
+                if logger := self.bot.get_cog('Logger'):
+                    await logger.log(f"스냅샷 생성 중 오류 발생: {e}", "LotteryBackup.py")
+            await asyncio.sleep(SNAPSHOT_INTERVAL)
+
+    def _load_digests(self) -> dict:
+        """최신 스냅샷부터 거슬러 올라가며 길드마다 마지막으로 기록된 상태의 해시를 구합니다."""
+        digests = {}
+        for sid in reversed(list_snapshots()):
+            snapshot = load_snapshot(sid)
+            if not snapshot:
+                continue
+            for guild_id, entry in snapshot["guilds"].items():
+                if guild_id not in digests:
+                    digests[guild_id] = guild_digest(entry)
+        return digests
+
+    async def take_snapshot(self):
+        """설정/데이터를 같은 시점으로 읽어서 바뀐 길드만 스냅샷으로 남깁니다.
+
+        잠금은 두 파일을 읽는 동안만 쥐고, 비교와 압축 저장은 별도 스레드에서 처리합니다.
+        바뀐 길드가 없으면 (None, 0)을, 아니면 (스냅샷 ID, 길드 수)를 반환합니다.
+        """
+        async with self._lock:
+            with transaction():
+                config = load_config()
+                data = load_data()
+            now = datetime.datetime.now()
+            return await asyncio.to_thread(self._write_changed, config, data, now)
+
+    def _write_changed(self, config: dict, data: dict, now: datetime.datetime):
+        changed = {}
+        digests = {}
+        for guild_id in set(config) | set(data) | set(self.digests):
+            entry = None
+            if guild_id in config or guild_id in data:
+                entry = {"config": config.get(guild_id), "data": data.get(guild_id)}
+            digest = guild_digest(entry)
+            if digest != self.digests.get(guild_id):
+                changed[guild_id] = entry
+            digests[guild_id] = digest
+
+        if not changed:
+            return None, 0
+
+        snapshot_id = now.strftime(SNAPSHOT_ID_FORMAT)
+        existing = set(list_snapshots())
+        suffix = 2
+        while snapshot_id in existing:
+            snapshot_id = f"{now.strftime(SNAPSHOT_ID_FORMAT)}-{suffix}"
+            suffix += 1
+
+        write_snapshot(snapshot_id, now.isoformat(), changed)
+        self.digests = digests
+        return snapshot_id, len(changed)
+
+    def _prune(self):
+        """보관 기간이 지난 스냅샷을 지웁니다.
+
+        지우는 스냅샷에만 남아 있는 길드 상태는 바로 다음 스냅샷으로 옮겨서,
+        남은 스냅샷 시점으로의 복원 결과가 달라지지 않게 합니다.
+        """
+        snapshot_ids = list_snapshots()
+        if len(snapshot_ids) < 2:
+            return
+
+        now = datetime.datetime.now()
+        keep_all_after = now - datetime.timedelta(hours=KEEP_ALL_HOURS)
+        keep_daily_after = now - datetime.timedelta(days=KEEP_DAILY_DAYS)
+
+        # 하루에 하나(그날의 마지막 스냅샷)만 남길 날짜별 대표
+        daily = {}
+        for sid in snapshot_ids:
+            daily[_parse_snapshot_id(sid).date()] = sid
+
+        keep = {snapshot_ids[-1]}
+        for sid in snapshot_ids:
+            taken = _parse_snapshot_id(sid)
+            if taken >= keep_all_after or (taken >= keep_daily_after and daily[taken.date()] == sid):
+                keep.add(sid)
+
+        for i, sid in enumerate(snapshot_ids):
+            if sid in keep:
+                continue
+            snapshot = load_snapshot(sid)
+            next_id = snapshot_ids[i + 1]
+            next_snapshot = load_snapshot(next_id)
+            if snapshot and next_snapshot is not None:
+                carried = {g: e for g, e in snapshot["guilds"].items() if g not in next_snapshot["guilds"]}
+                if carried:
+                    next_snapshot["guilds"].update(carried)
+                    write_snapshot(next_id, next_snapshot["taken_at"], next_snapshot["guilds"])
+            delete_snapshot(sid)
+
+    # --- 명령어 ---
+
+    @commands.command(name='스냅샷')
+    @commands.is_owner()
+    async def snapshot_now(self, ctx):
+        """지금 상태의 스냅샷을 바로 남깁니다."""
+        snapshot_id, count = await self.take_snapshot()
+        if snapshot_id is None:
+            await ctx.send("📸 마지막 스냅샷 이후 바뀐 길드가 없습니다.")
+            return
+        await ctx.send(f"📸 스냅샷 `{snapshot_id}`을(를) 남겼습니다. (바뀐 길드 {count}개)")
+
+    @commands.command(name='스냅샷목록')
+    @commands.is_owner()
+    async def snapshot_list(self, ctx, guild_id: str = None):
+        """스냅샷 목록을 표시합니다. 길드 ID를 주면 그 길드가 바뀐 스냅샷만 표시합니다."""
+        if guild_id:
+            # 스냅샷을 모두 열어봐야 하므로 별도 스레드에서 처리
+            snapshot_ids = await asyncio.to_thread(list_guild_snapshots, guild_id)
+        else:
+            snapshot_ids = list_snapshots()
+
+        lines = [f"`{sid}`" for sid in snapshot_ids[-LIST_LIMIT:]]
+        if len(snapshot_ids) > LIST_LIMIT:
+            lines.insert(0, f"...이전 {len(snapshot_ids) - LIST_LIMIT}개 생략")
+
+        embed = discord.Embed(
+            title="📸 스냅샷 목록" + (f" (길드 {guild_id})" if guild_id else ""),
+            description="\n".join(lines) or "없음",
+            color=discord.Color.blue()
+        )
+        await ctx.send(embed=embed)
+
+    @commands.command(name='스냅샷복원')
+    @commands.is_owner()
+    async def snapshot_restore(self, ctx, guild_id: str, snapshot_id: str):
+        """길드의 뽑기 설정과 유저 데이터를 지정한 스냅샷 시점으로 되돌립니다."""
+        if snapshot_id not in list_snapshots():
+            await ctx.send(f"⚠️ `{snapshot_id}` 스냅샷이 없습니다. `*스냅샷목록`으로 확인해주세요.")
+            return
+
+        source_id, entry = await asyncio.to_thread(find_guild_snapshot, guild_id, snapshot_id)
+        if source_id is None:
+            await ctx.send(f"⚠️ `{snapshot_id}` 시점까지 길드 {guild_id}의 기록이 없습니다.")
+            return
+
+        # 복원 전 상태도 되돌릴 수 있도록 먼저 스냅샷을 남김
+        before_id, _ = await self.take_snapshot()
+
+        with transaction():
+            config = load_config()
+            data = load_data()
+            if entry and entry.get("config") is not None:
+                config[guild_id] = entry["config"]
+            else:
+                config.pop(guild_id, None)
+            if entry and entry.get("data") is not None:
+                data[guild_id] = entry["data"]
+            else:
+                data.pop(guild_id, None)
+            save_config(config)
+            save_data(data)
+
+        # 뽑기판 View와 게시된 메시지를 복원된 상태로 갱신
+        board_cog = self.bot.get_cog("LotteryBoard")
+        if board_cog:
+            board_cog.refresh_guild_views(guild_id)
+
+        before = f"복원 전 상태: `{before_id or list_snapshots()[-1]}`"
+        await ctx.send(f"⏪ 길드 {guild_id}을(를) `{snapshot_id}` 시점으로 복원했습니다. ({before})")
+        if logger := self.bot.get_cog('Logger'):
+            await logger.log(f"길드 {guild_id}의 뽑기 상태를 스냅샷 {snapshot_id}(으)로 복원했습니다. ({before})", "LotteryBackup.py")
+
+    async def cog_command_error(self, ctx, error):
+        if isinstance(error, commands.MissingRequiredArgument):
+            await ctx.send("필요한 인자가 부족합니다. 명령어를 확인해주세요.")
+        elif isinstance(error, commands.CheckFailure):
+            pass
+        else:
+            print(f"LotteryBackup 오류: {error}")
+            logger = self.bot.get_cog('Logger')
+            if logger:
+                await logger.log(f"LotteryBackup 오류: {error}", "LotteryBackup.py")
+
+
+async def setup(bot):
+    await bot.add_cog(LotteryBackup(bot))
@@ -1,61 +1,80 @@
 import discord
 from discord.ext import commands
 from discord import ui
+import asyncio
+import collections
 import random
 import datetime
-import json
-import os
 
-# JSON 파일 경로
-CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'lottery_config.json')
-DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'lottery_data.json')
+from monitor_utils import timed_callback
+from webhook_pool import WebhookPool
+from lottery_store import (
+    NUMBERS_PER_BOARD, BOARD_COUNT, alert_channel_ids,
+    load_config, save_config, load_data, save_data, transaction, owns_guild,
+    get_event, get_event_user, draw_prize, board_custom_id, info_custom_id,
+    record_user_draw, ensure_draw_index,
+)
 
-TOTAL_NUMBERS = 100
-NUMBERS_PER_BOARD = 25
 DAILY_CLAIM_LIMIT = 1
+UNLOAD_DRAIN_TIMEOUT = 10
+ALERT_BATCH_SIZE = 20       # 알림 작업 루프가 한 번에 큐에서 꺼내는 최대 알림 수
+
+
+def get_board_state(bot) -> dict:
+    """cog 재로드 사이에도 유지되는 LotteryBoard 메모리 상태를 가져옵니다.
+
+    버전이 바뀐 cog도 그대로 넘겨받을 수 있도록 기본 자료형으로만 구성하고 bot에 붙여 둡니다.
+    """
+    state = getattr(bot, "lottery_board_state", None)
+    if state is None:
+        state = {
+            "board_edits": {},              # message_id -> (message, guild_id, event_name, board_idx)
+            "alerts": collections.deque(),  # {"channel_ids", "content", "embed"} (channel_ids는 아직 보내지 않은 채널)
+            "wakeup": asyncio.Event(),      # 뽑기판 갱신 작업 루프 깨우기
+            "alert_wakeup": asyncio.Event(),  # 알림 작업 루프 깨우기
+            "closing": set(),               # 언로드된 인스턴스가 마무리 중인 작업 (재로드 후에도 참조 유지)
+            "render_cache": {},             # (guild_id, event_name, board_idx) -> 직렬화된 컴포넌트
+            "board_views": {},              # (guild_id, event_name, board_idx) -> LotteryBoardView
+        }
+        bot.lottery_board_state = state
+    return state
+
+
+# --- 뽑기판 렌더 캐시 ---
+
+def _button_payload(guild_id: str, event_name: str, number: int, is_drawn: bool) -> dict:
+    """LotteryNumberButton과 같은 모양의 버튼 컴포넌트 dict를 만듭니다."""
+    style = discord.ButtonStyle.secondary if is_drawn else discord.ButtonStyle.success
+    return {
+        "type": 2,
+        "style": style.value,
+        "disabled": is_drawn,
+        "label": str(number),
+        "custom_id": board_custom_id(guild_id, event_name, number)
+    }
+
+
+def render_board_payload(render_cache: dict, guild_id: str, event_name: str, board_idx: int, drawn: dict) -> list:
+    """뽑기판 하나의 컴포넌트를 직렬화해서 캐시에 저장합니다."""
+    rows = [{"type": 1, "components": []} for _ in range(NUMBERS_PER_BOARD // 5)]
+    start_num = board_idx * NUMBERS_PER_BOARD + 1
+    for num in range(start_num, start_num + NUMBERS_PER_BOARD):
+        rows[(num - 1) % NUMBERS_PER_BOARD // 5]["components"].append(
+            _button_payload(guild_id, event_name, num, str(num) in drawn)
+        )
+    render_cache[(guild_id, event_name, board_idx)] = rows
+    return rows
 
 
-def load_config():
-    try:
-        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
-
-
-def save_config(data):
-    os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-    with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
-def load_data():
-    try:
-        with open(DATA_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
-
-
-def save_data(data):
-    os.makedirs(os.path.dirname(DATA_PATH), exist_ok=True)
-    with open(DATA_PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
-def get_user_data(guild_id: str, user_id: str) -> dict:
-    """유저 데이터를 가져오거나 초기화합니다."""
-    data = load_data()
-    guild_data = data.setdefault(guild_id, {})
-    if user_id not in guild_data:
-        guild_data[user_id] = {
-            "tickets": 0,
-            "total_draws": 0,
-            "daily_claims": 0,
-            "last_claim_date": None
-        }
-        save_data(data)
-    return guild_data[user_id]
+def mark_drawn_in_cache(render_cache: dict, guild_id: str, event_name: str, number: int):
+    """뽑힌 번호의 버튼 항목 하나만 캐시에서 고칩니다."""
+    rows = render_cache.get((guild_id, event_name, (number - 1) // NUMBERS_PER_BOARD))
+    if rows is None:
+        return
+    offset = (number - 1) % NUMBERS_PER_BOARD
+    button = rows[offset // 5]["components"][offset % 5]
+    button["style"] = discord.ButtonStyle.secondary.value
+    button["disabled"] = True
 
 
 def reset_daily_if_needed(user_data: dict) -> bool:
@@ -82,6 +101,7 @@ CLAIM_ALREADY_DONE = "...{user}... 오늘은 이미 충분한 기회를 줬어..
 DRAW_WIN = "...! 뭔가... 반짝이는 게 보여...... **{prize}**(이)라니... 축하해...... ✨"
 DRAW_LOSE = "......아무것도 없었어... 다음엔... 좋은 게 나올지도......"
 DRAW_NO_TICKETS = "...뽑기권이 없어... 먼저 뽑기권을 받아와......"
+EVENT_ENDED = "...이 뽑기는 이미 끝났어...... 다음 뽑기를 기다려줘......"
 
 INFO_TEMPLATE = (
     "**🎫 {user}의 뽑기 정보**\n\n"
@@ -90,71 +110,79 @@ INFO_TEMPLATE = (
     "오늘 남은 뽑기권 획득 기회: **{remaining_claims}**회"
 )
 
+MY_WINS_TITLE = "**🏆 {user}의 당첨 내역**\n\n"
+MY_WINS_EMPTY = "...아직 뽑은 번호가 없어...... 뽑기판에서 번호를 골라봐......"
+MY_WINS_LIMIT = 20
+
 
 # --- Persistent Views ---
 
 class LotteryNumberButton(ui.Button):
     """뽑기판의 개별 번호 버튼"""
 
-    def __init__(self, number: int, guild_id: str, is_drawn: bool):
+    def __init__(self, number: int, guild_id: str, event_name: str, is_drawn: bool):
         self.number = number
         self.guild_id = guild_id
+        self.event_name = event_name
         super().__init__(
             label=str(number),
             style=discord.ButtonStyle.secondary if is_drawn else discord.ButtonStyle.success,
             disabled=is_drawn,
-            custom_id=f"lottery_number:{guild_id}:{number}",
+            custom_id=board_custom_id(guild_id, event_name, number),
             row=(number - 1) % NUMBERS_PER_BOARD // 5
         )
 
+    @timed_callback("뽑기판 번호")
     async def callback(self, interaction: discord.Interaction):
         guild_id = self.guild_id
         user_id = str(interaction.user.id)
 
-        # 유저 데이터 확인
-        data = load_data()
-        guild_data = data.setdefault(guild_id, {})
-        user_data = guild_data.setdefault(user_id, {
-            "tickets": 0, "total_draws": 0, "daily_claims": 0, "last_claim_date": None
-        })
-
-        if user_data["tickets"] <= 0:
-            await interaction.response.send_message(
-                DRAW_NO_TICKETS.format(user=interaction.user.mention),
-                ephemeral=True
-            )
-            return
-
-        # 이미 뽑힌 번호 확인
-        config = load_config()
-        gc = config.get(guild_id, {})
-        drawn = gc.get("drawn_numbers", {})
-
-        if str(self.number) in drawn:
-            await interaction.response.send_message(
-                "...이 번호는 이미 누군가가 뽑았어......",
-                ephemeral=True
-            )
+        # 판정과 저장은 잠금 안에서 await 없이 처리 (다른 샤드와 직렬화)
+        error = None
+        state = get_board_state(interaction.client)
+        with transaction():
+            config = load_config()
+            gc = config.get(guild_id, {})
+            event = get_event(config, guild_id, self.event_name)
+
+            data = load_data()
+            user_data = get_event_user(data, guild_id, self.event_name, user_id)
+            drawn = event.get("drawn_numbers", {}) if event else {}
+
+            if event is None:
+                # 이벤트 확인
+                error = EVENT_ENDED
+            elif user_data["tickets"] <= 0:
+                # 유저 데이터 확인
+                error = DRAW_NO_TICKETS.format(user=interaction.user.mention)
+            elif str(self.number) in drawn:
+                # 이미 뽑힌 번호 확인
+                error = "...이 번호는 이미 누군가가 뽑았어......"
+            else:
+                # 뽑기 실행 (이전 버전 유저는 이번 번호를 기록하기 전에 유저별 기록을 먼저 채움)
+                ensure_draw_index(user_data, event, user_id)
+                user_data["tickets"] -= 1
+                user_data["total_draws"] += 1
+
+                # 경품 결과
+                prize = draw_prize(event, self.number)
+                record_user_draw(user_data, self.number, prize)
+                save_data(data)
+
+                # 뽑힌 번호 기록 (표시 이름은 조회할 때 가져오므로 저장하지 않음)
+                drawn[str(self.number)] = {
+                    "user_id": user_id,
+                    "prize": prize
+                }
+                event["drawn_numbers"] = drawn
+                save_config(config)
+                # 캐시도 await 전에 고쳐서, 그사이 초기화/복원으로 다시 그린 캐시에 이 번호가 남지 않게 함
+                mark_drawn_in_cache(state["render_cache"], guild_id, self.event_name, self.number)
+
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
             return
 
-        # 뽑기 실행
-        user_data["tickets"] -= 1
-        user_data["total_draws"] += 1
-        save_data(data)
-
-        # 경품 결과
-        shuffled = gc.get("shuffled_prizes", [])
-        prize = shuffled[self.number - 1] if self.number - 1 < len(shuffled) else "꽝"
-
-        # 뽑힌 번호 기록
-        drawn[str(self.number)] = {
-            "user_id": user_id,
-            "user_name": interaction.user.display_name,
-            "prize": prize
-        }
-        gc["drawn_numbers"] = drawn
-        save_config(config)
-
         # 유저에게 결과 전송
         if prize == "꽝":
             result_msg = DRAW_LOSE
@@ -166,72 +194,107 @@ class LotteryNumberButton(ui.Button):
             ephemeral=True
         )
 
-        # 버튼 상태 업데이트 (현재 메시지의 뷰 갱신)
+        # 뽑기판 갱신과 알림은 큐에 넣고 LotteryBoard의 작업 루프에서 처리
+        # (cog 재로드 중에도 큐는 bot에 남아 있으므로 클릭이 유실되지 않음)
         board_idx = (self.number - 1) // NUMBERS_PER_BOARD
-        new_view = LotteryBoardView(guild_id, board_idx)
-        await interaction.message.edit(view=new_view)
-
-        # 알림 채널에 결과 전송
-        alert_channel_id = gc.get("alert_channel_id")
-        if alert_channel_id:
-            alert_channel = interaction.guild.get_channel(alert_channel_id)
-            if alert_channel:
-                if prize != "꽝":
-                    mention_role_id = gc.get("mention_role_id")
-                    role_mention = f"<@&{mention_role_id}>" if mention_role_id else ""
-                    alert_embed = discord.Embed(
-                        title="🎉 당첨!",
-                        description=f"{interaction.user.mention}님이 **{self.number}번**에서 **{prize}**에 당첨되었습니다!",
-                        color=discord.Color.gold()
-                    )
-                    await alert_channel.send(content=role_mention, embed=alert_embed)
-                else:
-                    alert_embed = discord.Embed(
-                        title="🎰 뽑기 결과",
-                        description=f"{interaction.user.mention}님이 **{self.number}번**을 뽑았습니다. (꽝)",
-                        color=discord.Color.greyple()
-                    )
-                    await alert_channel.send(embed=alert_embed)
+        state["board_edits"][interaction.message.id] = (interaction.message, guild_id, self.event_name, board_idx)
+
+        # 알림은 경로별 필터(전체/당첨만)에 맞는 채널에만 보냄
+        is_win = prize != "꽝"
+        channel_ids = alert_channel_ids(gc, is_win)
+        if channel_ids:
+            if is_win:
+                mention_role_id = gc.get("mention_role_id")
+                role_mention = f"<@&{mention_role_id}>" if mention_role_id else ""
+                alert_embed = discord.Embed(
+                    title="🎉 당첨!",
+                    description=f"{interaction.user.mention}님이 **{self.number}번**에서 **{prize}**에 당첨되었습니다!",
+                    color=discord.Color.gold()
+                )
+                state["alerts"].append({"channel_ids": channel_ids, "content": role_mention, "embed": alert_embed})
+            else:
+                alert_embed = discord.Embed(
+                    title="🎰 뽑기 결과",
+                    description=f"{interaction.user.mention}님이 **{self.number}번**을 뽑았습니다. (꽝)",
+                    color=discord.Color.greyple()
+                )
+                state["alerts"].append({"channel_ids": channel_ids, "content": None, "embed": alert_embed})
+            state["alert_wakeup"].set()
+
+        state["wakeup"].set()
 
 
 class LotteryBoardView(ui.View):
-    """5x5 뽑기판 View"""
+    """5x5 뽑기판 View
 
-    def __init__(self, guild_id: str, board_idx: int):
+    render_cache를 받으면 전송/수정 시 버튼을 다시 직렬화하지 않고 캐시된 컴포넌트를 사용합니다.
+    """
+
+    def __init__(self, guild_id: str, event_name: str, board_idx: int, config: dict = None, render_cache: dict = None):
         super().__init__(timeout=None)
         self.guild_id = guild_id
+        self.event_name = event_name
         self.board_idx = board_idx
+        self.render_cache = render_cache
 
-        config = load_config()
-        gc = config.get(guild_id, {})
-        drawn = gc.get("drawn_numbers", {})
+        if config is None:
+            config = load_config()
+        event = get_event(config, guild_id, event_name) or {}
+        drawn = event.get("drawn_numbers", {})
 
         start_num = board_idx * NUMBERS_PER_BOARD + 1
         for i in range(NUMBERS_PER_BOARD):
             num = start_num + i
             is_drawn = str(num) in drawn
-            self.add_item(LotteryNumberButton(num, guild_id, is_drawn))
+            self.add_item(LotteryNumberButton(num, guild_id, event_name, is_drawn))
+
+        if render_cache is not None and (guild_id, event_name, board_idx) not in render_cache:
+            render_board_payload(render_cache, guild_id, event_name, board_idx, drawn)
+
+    def to_components(self):
+        if self.render_cache is not None:
+            payload = self.render_cache.get((self.guild_id, self.event_name, self.board_idx))
+            if payload is not None:
+                return payload
+        return super().to_components()
 
 
 class LotteryInfoView(ui.View):
     """뽑기권 안내 메시지 View"""
 
-    def __init__(self, guild_id: str):
+    def __init__(self, guild_id: str, event_name: str):
         super().__init__(timeout=None)
         self.guild_id = guild_id
+        self.event_name = event_name
+
+        # 이벤트마다 custom_id 네임스페이스를 분리
+        self.check_info.custom_id = info_custom_id("info_check", event_name)
+        self.claim_ticket.custom_id = info_custom_id("claim_ticket", event_name)
+        self.my_wins.custom_id = info_custom_id("my_wins", event_name)
+
+    async def _ensure_event(self, interaction: discord.Interaction) -> bool:
+        """이벤트가 아직 진행 중인지 확인합니다."""
+        config = load_config()
+        if get_event(config, str(interaction.guild.id), self.event_name) is None:
+            await interaction.response.send_message(EVENT_ENDED, ephemeral=True)
+            return False
+        return True
 
     @ui.button(label="🎫 내 뽑기 정보", style=discord.ButtonStyle.primary, custom_id="lottery_info_check")
+    @timed_callback("내 뽑기 정보")
     async def check_info(self, interaction: discord.Interaction, button: ui.Button):
         guild_id = str(interaction.guild.id)
         user_id = str(interaction.user.id)
 
-        user_data = get_user_data(guild_id, user_id)
-        reset_daily_if_needed(user_data)
+        if not await self._ensure_event(interaction):
+            return
 
         # 저장 (날짜 리셋 반영)
-        data = load_data()
-        data.setdefault(guild_id, {})[user_id] = user_data
-        save_data(data)
+        with transaction():
+            data = load_data()
+            user_data = get_event_user(data, guild_id, self.event_name, user_id)
+            if reset_daily_if_needed(user_data):
+                save_data(data)
 
         remaining = DAILY_CLAIM_LIMIT - user_data["daily_claims"]
         msg = INFO_TEMPLATE.format(
@@ -243,70 +306,304 @@ class LotteryInfoView(ui.View):
         await interaction.response.send_message(msg, ephemeral=True)
 
     @ui.button(label="🎁 뽑기권 받기", style=discord.ButtonStyle.success, custom_id="lottery_claim_ticket")
+    @timed_callback("뽑기권 받기")
     async def claim_ticket(self, interaction: discord.Interaction, button: ui.Button):
         guild_id = str(interaction.guild.id)
         user_id = str(interaction.user.id)
 
-        data = load_data()
-        guild_data = data.setdefault(guild_id, {})
-        user_data = guild_data.setdefault(user_id, {
-            "tickets": 0, "total_draws": 0, "daily_claims": 0, "last_claim_date": None
-        })
+        if not await self._ensure_event(interaction):
+            return
+
+        amount = None
+        with transaction():
+            data = load_data()
+            user_data = get_event_user(data, guild_id, self.event_name, user_id)
+
+            reset_daily_if_needed(user_data)
 
-        reset_daily_if_needed(user_data)
+            if user_data["daily_claims"] < DAILY_CLAIM_LIMIT:
+                # 1~5 랜덤 뽑기권 지급
+                amount = random.randint(1, 5)
+                user_data["tickets"] += amount
+                user_data["daily_claims"] += 1
+                save_data(data)
 
-        if user_data["daily_claims"] >= DAILY_CLAIM_LIMIT:
+        if amount is None:
             await interaction.response.send_message(
                 CLAIM_ALREADY_DONE.format(user=interaction.user.mention),
                 ephemeral=True
             )
             return
 
-        # 1~5 랜덤 뽑기권 지급
-        amount = random.randint(1, 5)
-        user_data["tickets"] += amount
-        user_data["daily_claims"] += 1
-        save_data(data)
-
         msg_template = random.choice(CLAIM_MESSAGES)
         await interaction.response.send_message(
             msg_template.format(user=interaction.user.mention, n=amount),
             ephemeral=True
         )
 
+    @ui.button(label="🏆 내 당첨 내역", style=discord.ButtonStyle.secondary, custom_id="lottery_my_wins")
+    @timed_callback("내 당첨 내역")
+    async def my_wins(self, interaction: discord.Interaction, button: ui.Button):
+        guild_id = str(interaction.guild.id)
+        user_id = str(interaction.user.id)
+
+        config = load_config()
+        event = get_event(config, guild_id, self.event_name)
+        if event is None:
+            await interaction.response.send_message(EVENT_ENDED, ephemeral=True)
+            return
+
+        # 유저 본인의 기록만 읽음 (이전 버전 유저는 처음 한 번만 채워서 저장)
+        user_data = get_event_user(load_data(), guild_id, self.event_name, user_id)
+        if "draws" not in user_data:
+            with transaction():
+                data = load_data()
+                user_data = get_event_user(data, guild_id, self.event_name, user_id)
+                if ensure_draw_index(user_data, event, user_id):
+                    save_data(data)
+
+        draws = user_data["draws"]
+        if not draws:
+            await interaction.response.send_message(MY_WINS_EMPTY, ephemeral=True)
+            return
+
+        wins = [d for d in draws if d["prize"] != "꽝"]
+        lines = [f"`{d['number']}번` **{d['prize']}**" for d in wins[-MY_WINS_LIMIT:]]
+        if len(wins) > MY_WINS_LIMIT:
+            lines.insert(0, f"...이전 당첨 {len(wins) - MY_WINS_LIMIT}건 생략")
+        summary = f"뽑은 번호 **{len(draws)}**개 중 당첨 **{len(wins)}**개"
+        msg = MY_WINS_TITLE.format(user=interaction.user.display_name) + "\n".join(lines + ["", summary]).lstrip("\n")
+        await interaction.response.send_message(msg, ephemeral=True)
+
 
 class LotteryBoard(commands.Cog):
     """뽑기판 UI 및 상호작용"""
 
     def __init__(self, bot):
         self.bot = bot
+        self.state = get_board_state(bot)
+        self.webhooks = WebhookPool(bot)
+        self._workers = []
+        self._stopping = False
+        self._busy = set()      # 작업 중인 루프 이름
 
     async def cog_load(self):
-        """Persistent View 등록"""
+        """Persistent View 등록 (진행 중인 이벤트만)
+
+        재로드 시에는 이전 인스턴스가 남긴 큐를 그대로 이어받고,
+        새 View를 모두 만든 뒤 await 없이 한 번에 교체합니다.
+        """
         config = load_config()
+        views = {}
+        board_views = {}
         for guild_id, gc in config.items():
-            # 뽑기판 View 등록
-            if gc.get("board_message_ids"):
-                for board_idx in range(4):
-                    view = LotteryBoardView(guild_id, board_idx)
-                    self.bot.add_view(view)
-
-            # 안내 메시지 View 등록
-            if gc.get("info_message_id"):
-                view = LotteryInfoView(guild_id)
-                self.bot.add_view(view)
+            # 다른 샤드(프로세스)가 맡은 길드는 등록하지 않음
+            if not owns_guild(self.bot, guild_id):
+                continue
+            for event_name, event in gc.get("events", {}).items():
+                # 뽑기판 View
+                message_ids = event.get("board_message_ids") or []
+                if message_ids:
+                    for board_idx in range(BOARD_COUNT):
+                        # 재로드 시에는 이미 캐시된 컴포넌트를 그대로 사용
+                        view = LotteryBoardView(guild_id, event_name, board_idx, config, self.state["render_cache"])
+                        mid = message_ids[board_idx] if board_idx < len(message_ids) else None
+                        views[("board", guild_id, event_name, board_idx)] = (view, mid)
+                        board_views[(guild_id, event_name, board_idx)] = view
+
+                # 안내 메시지 View
+                if event.get("info_message_id"):
+                    view = LotteryInfoView(guild_id, event_name)
+                    views[("info", guild_id, event_name)] = (view, event["info_message_id"])
+
+        # 메시지에 묶인 View가 persistent View보다 우선하므로 둘 다 교체
+        for view, mid in views.values():
+            self.bot.add_view(view)
+            if mid:
+                self.bot.add_view(view, message_id=mid)
+        self.state["board_views"] = board_views
+
+        # 알림은 별도 루프에서 보내므로 알림이 밀려도 뽑기판 갱신은 기다리지 않음
+        await self.webhooks.start()
+        self._workers = [
+            asyncio.create_task(self._process_updates()),
+            asyncio.create_task(self._process_alerts()),
+        ]
+        if self.state["board_edits"]:
+            self.state["wakeup"].set()
+        if self.state["alerts"]:
+            self.state["alert_wakeup"].set()
 
         print(f"✅ {self.__class__.__name__} loaded successfully!")
 
-    def create_board_view(self, guild_id: str, board_idx: int) -> LotteryBoardView:
-        """LotteryConfig에서 호출할 뽑기판 View 생성"""
-        view = LotteryBoardView(guild_id, board_idx)
+    async def cog_unload(self):
+        """진행 중인 전송만 마무리하고, 남은 큐는 다음 인스턴스에 넘깁니다.
+
+        웹훅 전송을 중간에 취소하면 discord.py가 그 웹훅의 잠금을 풀지 못하고 이미 보낸 알림이 다시 보내질 수 있으므로,
+        제한 시간 안에 멈추지 않은 작업 루프는 취소하지 않고 백그라운드에서 끝까지 기다린 뒤 웹훅 세션을 닫습니다.
+        보내지 못한 알림은 작업 루프가 끝날 때 큐 앞쪽으로 되돌아갑니다.
+        """
+        self._stopping = True
+        self.state["wakeup"].set()
+        self.state["alert_wakeup"].set()
+        if self._workers:
+            done, pending = await asyncio.wait(self._workers, timeout=UNLOAD_DRAIN_TIMEOUT)
+            if pending:
+                print("⚠️ LotteryBoard 작업 루프가 제시간에 멈추지 않아 백그라운드에서 마무리합니다.")
+                task = asyncio.create_task(self._close_when_done(pending))
+                self.state["closing"].add(task)
+                task.add_done_callback(self.state["closing"].discard)
+            else:
+                await self.webhooks.close()
+        else:
+            await self.webhooks.close()
+        # 남은 작업이 있으면 다음 인스턴스가 시작하자마자 처리하도록 표시
+        if self.state["board_edits"]:
+            self.state["wakeup"].set()
+        if self.state["alerts"]:
+            self.state["alert_wakeup"].set()
+
+    async def _close_when_done(self, workers):
+        await asyncio.wait(workers)
+        await self.webhooks.close()
+        # 되돌아온 알림을 새 인스턴스가 처리하도록 깨움
+        if self.state["alerts"]:
+            self.state["alert_wakeup"].set()
+
+    async def _process_updates(self):
+        """큐에 쌓인 뽑기판 갱신을 처리합니다."""
+        state = self.state
+        while not self._stopping:
+            await state["wakeup"].wait()
+            if self._stopping:
+                break
+            state["wakeup"].clear()
+            self._busy.add("board")
+
+            # 뽑기판 갱신 (메시지마다 최신 상태로 한 번만 수정)
+            while state["board_edits"] and not self._stopping:
+                message_id = next(iter(state["board_edits"]))
+                message, guild_id, event_name, board_idx = state["board_edits"].pop(message_id)
+                view = state["board_views"].get((guild_id, event_name, board_idx))
+                if view is None:
+                    view = LotteryBoardView(guild_id, event_name, board_idx, render_cache=state["render_cache"])
+                    state["board_views"][(guild_id, event_name, board_idx)] = view
+                try:
+                    await message.edit(view=view)
+                except Exception as e:
+                    print(f"뽑기판 갱신 중 오류 발생: {e}")
+            self._busy.discard("board")
+
+    async def _process_alerts(self):
+        """큐에 쌓인 알림을 웹훅으로 보냅니다.
+
+        채널마다 순서는 지키면서, 여러 채널에는 동시에 보냅니다.
+        """
+        state = self.state
+        while not self._stopping:
+            await state["alert_wakeup"].wait()
+            if self._stopping:
+                break
+            state["alert_wakeup"].clear()
+            self._busy.add("alerts")
+
+            while state["alerts"] and not self._stopping:
+                # 한 번에 일부만 꺼냄 (보낸 채널은 _send_alerts가 알림의 channel_ids에서 지움)
+                batch = []
+                while state["alerts"] and len(batch) < ALERT_BATCH_SIZE:
+                    batch.append(state["alerts"].popleft())
+
+                by_channel = {}
+                for alert in batch:
+                    for channel_id in alert["channel_ids"]:
+                        by_channel.setdefault(channel_id, []).append(alert)
+                try:
+                    await asyncio.gather(*(
+                        self._send_alerts(channel_id, alerts) for channel_id, alerts in by_channel.items()
+                    ))
+                finally:
+                    # 멈추거나 취소되어 보내지 못한 채널이 남은 알림은 순서대로 큐 앞쪽에 되돌림
+                    for alert in reversed(batch):
+                        if alert["channel_ids"]:
+                            state["alerts"].appendleft(alert)
+            self._busy.discard("alerts")
+
+    async def _send_alerts(self, channel_id: int, alerts: list):
+        """한 채널에 알림을 순서대로 보내고, 보낸 알림에서 채널을 지웁니다."""
+        for alert in alerts:
+            if self._stopping:
+                return
+            try:
+                found = await self.webhooks.send(channel_id, content=alert["content"], embed=alert["embed"])
+            except Exception as e:
+                print(f"뽑기 알림 전송 중 오류 발생: {e}")
+                found = True
+            if not found:
+                # 채널을 찾을 수 없으면 이 채널로 갈 알림은 모두 버림
+                for a in alerts:
+                    if channel_id in a["channel_ids"]:
+                        a["channel_ids"].remove(channel_id)
+                return
+            alert["channel_ids"].remove(channel_id)
+
+    async def drain(self, timeout: float) -> bool:
+        """큐에 남은 뽑기판 갱신과 알림을 모두 보낼 때까지 기다립니다. (종료 시 사용)
+
+        제한 시간 안에 모두 처리하면 True를 반환합니다.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        self.state["wakeup"].set()
+        self.state["alert_wakeup"].set()
+        while self.state["board_edits"] or self.state["alerts"] or self._busy:
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(0.05)
+        return True
+
+    def create_board_view(self, guild_id: str, event_name: str, board_idx: int) -> LotteryBoardView:
+        """LotteryConfig에서 호출할 뽑기판 View 생성 (생성/초기화 시 캐시도 새로 만듦)"""
+        config = load_config()
+        event = get_event(config, guild_id, event_name) or {}
+        render_board_payload(self.state["render_cache"], guild_id, event_name, board_idx, event.get("drawn_numbers", {}))
+        view = LotteryBoardView(guild_id, event_name, board_idx, config, self.state["render_cache"])
+        self.state["board_views"][(guild_id, event_name, board_idx)] = view
         self.bot.add_view(view)
         return view
 
-    def create_info_view(self, guild_id: str) -> LotteryInfoView:
+    def discard_event_views(self, guild_id: str, event_name: str):
+        """종료된 이벤트의 뽑기판 View와 렌더 캐시를 정리합니다."""
+        for board_idx in range(BOARD_COUNT):
+            self.state["render_cache"].pop((guild_id, event_name, board_idx), None)
+            self.state["board_views"].pop((guild_id, event_name, board_idx), None)
+
+    def refresh_guild_views(self, guild_id: str):
+        """복원 등으로 길드 설정이 통째로 바뀌었을 때 View와 렌더 캐시를 다시 만들고,
+        게시된 뽑기판 메시지를 새 상태로 갱신하도록 큐에 넣습니다."""
+        for key in [k for k in self.state["render_cache"] if k[0] == guild_id]:
+            self.state["render_cache"].pop(key, None)
+            self.state["board_views"].pop(key, None)
+
+        config = load_config()
+        for event_name, event in config.get(guild_id, {}).get("events", {}).items():
+            message_ids = event.get("board_message_ids") or []
+            channel = self.bot.get_channel(event.get("board_channel_id")) if message_ids else None
+            for board_idx, mid in enumerate(message_ids[:BOARD_COUNT]):
+                view = self.create_board_view(guild_id, event_name, board_idx)
+                self.bot.add_view(view, message_id=mid)
+                if channel:
+                    self.state["board_edits"][mid] = (channel.get_partial_message(mid), guild_id, event_name, board_idx)
+
+            if event.get("info_message_id"):
+                view = LotteryInfoView(guild_id, event_name)
+                self.bot.add_view(view)
+                self.bot.add_view(view, message_id=event["info_message_id"])
+
+        self.state["wakeup"].set()
+
+    def create_info_view(self, guild_id: str, event_name: str) -> LotteryInfoView:
         """LotteryConfig에서 호출할 안내 메시지 View 생성"""
-        view = LotteryInfoView(guild_id)
+        view = LotteryInfoView(guild_id, event_name)
         self.bot.add_view(view)
         return view
 
@@ -318,4 +615,4 @@ class LotteryBoard(commands.Cog):
 
 
 async def setup(bot):
-    await bot.add_cog(LotteryBoard(bot))
+    await bot.add_cog(LotteryBoard(bot))
\ No newline at end of file
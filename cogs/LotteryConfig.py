@@ -1,79 +1,89 @@
 import discord
 from discord.ext import commands
-import json
-import os
-import random
+from discord import ui
+import datetime
 
 from admin_utils import is_guild_admin
+from monitor_utils import timed_callback
+from lottery_store import (
+    TOTAL_NUMBERS, BOARD_COUNT, DEFAULT_EVENT, ALLOCATION_SHUFFLE, ALERT_ALL, ALERT_WINNERS,
+    load_config, save_config, load_data, save_data, transaction,
+    new_guild_config, new_event_config, validate_event_name,
+    get_event_user, shuffle_prizes, prepare_lazy_allocation, archive_event, load_archived_event, list_archived_events,
+)
+
+DEFAULT_PRIZES = [{"name": "꽝", "count": TOTAL_NUMBERS}]
+NO_ACTIVE_EVENT = "⚠️ 선택된 이벤트가 없습니다. `*뽑기설정 이벤트생성 (이름)` 또는 `*뽑기설정 이벤트선택 (이름)`을 실행해주세요."
+ALERT_FILTERS = {"전체": ALERT_ALL, "당첨": ALERT_WINNERS}
+ALERT_FILTER_LABELS = {ALERT_ALL: "모든 결과", ALERT_WINNERS: "당첨만"}
+PRIZE_INPUT_TIMEOUT = 300
+PRIZE_INPUT_PLACEHOLDER = "스타벅스 쿠폰 3\n문화상품권 1"
+
+
+def parse_prize_lines(text: str):
+    """'경품명 개수' 형식의 여러 줄을 [(경품명, 개수)]로 바꿉니다. 잘못된 줄이 있으면 (None, 오류 메시지)를 반환합니다."""
+    entries = []
+    for line_no, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line:
+            continue
+        parts = line.rsplit(maxsplit=1)
+        if len(parts) != 2 or not parts[1].isdecimal() or int(parts[1]) <= 0:
+            return None, f"{line_no}번째 줄 `{line}`: `경품명 개수` 형식으로, 개수는 1 이상으로 입력해주세요."
+        entries.append((parts[0], int(parts[1])))
+    if not entries:
+        return None, "추가할 경품을 한 줄에 하나씩 `경품명 개수` 형식으로 입력해주세요."
+    return entries, None
+
+
+# --- 경품 입력 폼 ---
+
+class PrizeInputModal(ui.Modal, title="경품 추가"):
+    """여러 경품을 한 번에 입력받는 폼"""
+
+    prizes = ui.TextInput(
+        label="경품 목록 (한 줄에 '경품명 개수')",
+        style=discord.TextStyle.paragraph,
+        placeholder=PRIZE_INPUT_PLACEHOLDER,
+        max_length=1000
+    )
+
+    def __init__(self, cog, guild_id: str, default: str = None):
+        super().__init__()
+        self.cog = cog
+        self.guild_id = guild_id
+        if default:
+            self.prizes.default = default
+
+    @timed_callback("경품 추가 폼")
+    async def on_submit(self, interaction: discord.Interaction):
+        embed, error = self.cog.apply_prize_entries(self.guild_id, self.prizes.value)
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
+            return
+        await interaction.response.send_message(embed=embed)
+
+
+class PrizeInputView(ui.View):
+    """명령어를 실행한 관리자만 경품 입력 폼을 열 수 있는 버튼"""
+
+    def __init__(self, cog, author_id: int, guild_id: str, default: str = None):
+        super().__init__(timeout=PRIZE_INPUT_TIMEOUT)
+        self.cog = cog
+        self.author_id = author_id
+        self.guild_id = guild_id
+        self.default = default
 
-# JSON 파일 경로
-CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'lottery_config.json')
-DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'lottery_data.json')
-
-TOTAL_NUMBERS = 100
-NUMBERS_PER_BOARD = 25
-DEFAULT_PRIZES = [{"name": "꽝", "count": 100}]
-
-
-def load_config():
-    """설정 파일을 로드합니다."""
-    try:
-        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
-
-
-def save_config(data):
-    """설정 파일을 저장합니다."""
-    os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-    with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
-def load_data():
-    """데이터 파일을 로드합니다."""
-    try:
-        with open(DATA_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {}
-
-
-def save_data(data):
-    """데이터 파일을 저장합니다."""
-    os.makedirs(os.path.dirname(DATA_PATH), exist_ok=True)
-    with open(DATA_PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-
-def get_guild_config(guild_id: str) -> dict:
-    """특정 길드의 설정을 가져옵니다."""
-    config = load_config()
-    if guild_id not in config:
-        config[guild_id] = {
-            "alert_channel_id": None,
-            "mention_role_id": None,
-            "prizes": [{"name": "꽝", "count": 100}],
-            "shuffled": False,
-            "shuffled_prizes": [],
-            "board_channel_id": None,
-            "board_message_ids": [],
-            "info_channel_id": None,
-            "info_message_id": None,
-            "drawn_numbers": {}
-        }
-        save_config(config)
-    return config[guild_id]
-
-
-def get_guild_data(guild_id: str) -> dict:
-    """특정 길드의 유저 데이터를 가져옵니다."""
-    data = load_data()
-    if guild_id not in data:
-        data[guild_id] = {}
-        save_data(data)
-    return data[guild_id]
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("명령어를 실행한 관리자만 사용할 수 있습니다.", ephemeral=True)
+            return False
+        return True
+
+    @ui.button(label="📝 경품 입력", style=discord.ButtonStyle.primary)
+    @timed_callback("경품 입력 버튼")
+    async def open_form(self, interaction: discord.Interaction, button: ui.Button):
+        await interaction.response.send_modal(PrizeInputModal(self.cog, self.guild_id, self.default))
 
 
 class LotteryConfig(commands.Cog):
@@ -96,6 +106,54 @@ class LotteryConfig(commands.Cog):
         lines.append(f"\n총 **{total}**개")
         return "\n".join(lines)
 
+    def _add_prize(self, event: dict, prize_name: str, count: int):
+        """꽝 개수를 차감해 경품을 추가합니다. 실패하면 오류 메시지를 반환합니다."""
+        prizes = event["prizes"]
+
+        # 총 경품 수 확인
+        total = sum(p['count'] for p in prizes)
+        if total < count:
+            return f"현재 총 경품 수({total}개)보다 많이 추가할 수 없습니다."
+
+        # 꽝 개수 차감
+        for p in prizes:
+            if p['name'] == '꽝':
+                if p['count'] < count:
+                    return f"꽝의 개수({p['count']}개)가 부족합니다."
+                p['count'] -= count
+                break
+
+        # 기존 경품이 있으면 합산, 없으면 추가
+        existing = next((p for p in prizes if p['name'] == prize_name), None)
+        if existing:
+            existing['count'] += count
+        else:
+            prizes.append({"name": prize_name, "count": count})
+
+        # 꽝이 0개면 제거
+        event["prizes"] = [p for p in prizes if p['count'] > 0]
+        event["shuffled"] = False
+        return None
+
+    def _get_guild_config(self, config: dict, guild_id: str) -> dict:
+        """설정에서 길드 설정을 가져오거나 초기화합니다."""
+        if guild_id not in config:
+            config[guild_id] = new_guild_config()
+        return config[guild_id]
+
+    def _get_active_event(self, config: dict, guild_id: str):
+        """관리 대상으로 선택된 이벤트를 가져옵니다. 없으면 (None, None)을 반환합니다."""
+        gc = self._get_guild_config(config, guild_id)
+        event_name = gc.get("active_event")
+        event = gc["events"].get(event_name)
+        if event is None:
+            return None, None
+        return event_name, event
+
+    def _event_label(self, event_name: str) -> str:
+        """메시지에 표시할 이벤트 이름을 반환합니다."""
+        return f"기본({DEFAULT_EVENT})" if event_name == DEFAULT_EVENT else event_name
+
     # --- 그룹 커맨드 ---
 
     @commands.group(name="뽑기설정", invoke_without_command=True)
@@ -107,11 +165,18 @@ class LotteryConfig(commands.Cog):
             color=discord.Color.gold()
         )
         cmds = [
+            ("`*뽑기설정 이벤트목록`", "진행 중인 이벤트와 종료된 이벤트를 확인합니다."),
+            ("`*뽑기설정 이벤트생성 (이름)`", "새 이벤트를 만들고 관리 대상으로 선택합니다."),
+            ("`*뽑기설정 이벤트선택 (이름)`", "아래 명령어들이 적용될 이벤트를 선택합니다."),
+            ("`*뽑기설정 이벤트종료 (이름)`", "이벤트를 종료하고 기록을 아카이브로 옮깁니다."),
+            ("`*뽑기설정 이벤트기록 (이름)`", "종료된 이벤트의 기록을 확인합니다."),
             ("`*뽑기설정 경품목록`", "현재 경품 구성을 확인합니다."),
-            ("`*뽑기설정 경품추가 (경품명)`", "경품을 추가합니다."),
+            ("`*뽑기설정 경품추가 [경품명]`", "입력 폼에서 여러 경품을 한 번에 추가합니다. 경품명을 주면 폼에 미리 채워집니다."),
             ("`*뽑기설정 경품셔플`", "경품 번호를 랜덤 배정합니다."),
+            ("`*뽑기설정 경품셔플 지연`", "경품 개수와 시드만 저장하고, 번호를 뽑을 때 경품을 정합니다."),
             ("`*뽑기설정 경품초기화`", "경품을 꽝 100개로 초기화합니다."),
-            ("`*뽑기설정 알림채널설정`", "뽑기 결과 알림 채널을 설정합니다."),
+            ("`*뽑기설정 알림채널설정 [전체|당첨]`", "현재 채널을 알림 채널로 추가합니다. `당첨`이면 당첨 결과만 보냅니다."),
+            ("`*뽑기설정 알림채널해제`", "현재 채널을 알림 채널에서 제외합니다."),
             ("`*뽑기설정 역할설정`", "당첨 시 멘션할 역할을 설정합니다."),
             ("`*뽑기설정 뽑기판생성`", "현재 채널에 뽑기판을 생성합니다."),
             ("`*뽑기설정 메시지생성`", "현재 채널에 뽑기권 안내 메시지를 생성합니다."),
@@ -120,140 +185,281 @@ class LotteryConfig(commands.Cog):
             embed.add_field(name=name, value=desc, inline=False)
         await ctx.send(embed=embed)
 
-    # --- 경품 관리 ---
+    # --- 이벤트 관리 ---
 
-    @lottery_settings.command(name="경품목록")
+    @lottery_settings.command(name="이벤트목록")
     @is_guild_admin()
-    async def prize_list(self, ctx):
-        """현재 경품 구성을 나열합니다."""
+    async def event_list(self, ctx):
+        """진행 중인 이벤트와 종료된 이벤트를 나열합니다."""
         guild_id = str(ctx.guild.id)
-        gc = get_guild_config(guild_id)
-        embed = discord.Embed(
-            title="🎁 현재 경품 목록",
-            description=self._format_prize_list(gc["prizes"]),
-            color=discord.Color.blue()
-        )
+        config = load_config()
+        gc = self._get_guild_config(config, guild_id)
+
+        lines = []
+        for name, event in gc["events"].items():
+            marker = " ⬅️ 선택됨" if name == gc.get("active_event") else ""
+            drawn = len(event.get("drawn_numbers", {}))
+            lines.append(f"• **{self._event_label(name)}** — {drawn}/{TOTAL_NUMBERS} 뽑힘{marker}")
+        live = "\n".join(lines) or "없음"
+
+        archived = ", ".join(self._event_label(n) for n in list_archived_events(guild_id)) or "없음"
+
+        embed = discord.Embed(title="📅 뽑기 이벤트 목록", color=discord.Color.blue())
+        embed.add_field(name="진행 중", value=live, inline=False)
+        embed.add_field(name="종료됨", value=archived, inline=False)
         await ctx.send(embed=embed)
 
-    @lottery_settings.command(name="경품추가")
+    @lottery_settings.command(name="이벤트생성")
     @is_guild_admin()
-    async def prize_add(self, ctx, *, prize_name: str):
-        """경품을 추가합니다. 추가 후 개수를 입력받습니다."""
+    async def event_create(self, ctx, *, event_name: str):
+        """새 이벤트를 만들고 관리 대상으로 선택합니다."""
         guild_id = str(ctx.guild.id)
+        error = validate_event_name(event_name)
+        if error:
+            await ctx.send(f"⚠️ {error}")
+            return
 
-        await ctx.send(f"**{prize_name}**을(를) 몇 개 추가할까요? (숫자를 입력해주세요)")
+        error = None
+        with transaction():
+            config = load_config()
+            gc = self._get_guild_config(config, guild_id)
+            if event_name in gc["events"]:
+                error = f"⚠️ **{event_name}** 이벤트가 이미 진행 중입니다."
+            elif event_name in list_archived_events(guild_id):
+                error = f"⚠️ **{event_name}** 이름의 종료된 이벤트가 있습니다. 다른 이름을 사용해주세요."
+            else:
+                gc["events"][event_name] = new_event_config()
+                gc["active_event"] = event_name
+                save_config(config)
+
+        if error:
+            await ctx.send(error)
+            return
 
-        def check(m):
-            return m.author == ctx.author and m.channel == ctx.channel and m.content.isdigit()
+        await ctx.send(f"📅 **{event_name}** 이벤트가 생성되어 선택되었습니다. 경품을 추가하고 셔플해주세요.")
 
-        try:
-            msg = await self.bot.wait_for('message', check=check, timeout=30.0)
-        except Exception:
-            await ctx.send("시간이 초과되었습니다. 다시 시도해주세요.")
+    @lottery_settings.command(name="이벤트선택")
+    @is_guild_admin()
+    async def event_select(self, ctx, *, event_name: str):
+        """설정 명령어가 적용될 이벤트를 선택합니다."""
+        with transaction():
+            config = load_config()
+            gc = self._get_guild_config(config, str(ctx.guild.id))
+            found = event_name in gc["events"]
+            if found:
+                gc["active_event"] = event_name
+                save_config(config)
+
+        if not found:
+            await ctx.send(f"⚠️ 진행 중인 **{event_name}** 이벤트가 없습니다.")
             return
 
-        count = int(msg.content)
-        if count <= 0:
-            await ctx.send("1 이상의 숫자를 입력해주세요.")
+        await ctx.send(f"✅ 이제부터 **{self._event_label(event_name)}** 이벤트를 설정합니다.")
+
+    @lottery_settings.command(name="이벤트종료")
+    @is_guild_admin()
+    async def event_end(self, ctx, *, event_name: str):
+        """이벤트를 종료하고 설정과 유저 기록을 압축 아카이브로 옮깁니다."""
+        guild_id = str(ctx.guild.id)
+        with transaction():
+            config = load_config()
+            gc = self._get_guild_config(config, guild_id)
+            event = gc["events"].get(event_name)
+            if event is not None:
+                data = load_data()
+                event_users = data.get(guild_id, {}).get(event_name, {})
+                archive_event(guild_id, event_name, event, event_users, datetime.datetime.now().isoformat())
+
+                # 아카이브 저장 후에만 진행 중 목록에서 제거
+                del gc["events"][event_name]
+                if gc.get("active_event") == event_name:
+                    gc["active_event"] = next(iter(gc["events"]), None)
+                save_config(config)
+
+                if event_name in data.get(guild_id, {}):
+                    del data[guild_id][event_name]
+                    save_data(data)
+
+        if event is None:
+            await ctx.send(f"⚠️ 진행 중인 **{event_name}** 이벤트가 없습니다.")
             return
 
-        config = load_config()
-        gc = config.setdefault(guild_id, get_guild_config(guild_id))
-        prizes = gc["prizes"]
+        board_cog = self.bot.get_cog("LotteryBoard")
+        if board_cog:
+            board_cog.discard_event_views(guild_id, event_name)
 
-        # 총 경품 수 확인
-        total = sum(p['count'] for p in prizes)
-        if total < count:
-            await ctx.send(f"현재 총 경품 수({total}개)보다 많이 추가할 수 없습니다.")
+        await ctx.send(f"📦 **{self._event_label(event_name)}** 이벤트가 종료되어 아카이브로 옮겨졌습니다.")
+
+    @lottery_settings.command(name="이벤트기록")
+    @is_guild_admin()
+    async def event_history(self, ctx, *, event_name: str):
+        """종료된 이벤트의 당첨 기록을 아카이브에서 불러옵니다."""
+        archived = load_archived_event(str(ctx.guild.id), event_name)
+        if archived is None:
+            await ctx.send(f"⚠️ 종료된 **{event_name}** 이벤트 기록이 없습니다.")
             return
 
-        # 꽝 개수 차감
-        for p in prizes:
-            if p['name'] == '꽝':
-                if p['count'] < count:
-                    await ctx.send(f"꽝의 개수({p['count']}개)가 부족합니다.")
-                    return
-                p['count'] -= count
-                break
+        event = archived["config"]
+        drawn = event.get("drawn_numbers", {})
+        winners = [
+            f"`{num}번` **{record['prize']}** — <@{record['user_id']}>"
+            for num, record in sorted(drawn.items(), key=lambda item: int(item[0]))
+            if record.get("prize") != "꽝"
+        ]
 
-        # 기존 경품이 있으면 합산, 없으면 추가
-        existing = next((p for p in prizes if p['name'] == prize_name), None)
-        if existing:
-            existing['count'] += count
-        else:
-            prizes.append({"name": prize_name, "count": count})
+        embed = discord.Embed(
+            title=f"📦 {self._event_label(event_name)} 이벤트 기록",
+            description=f"종료: {archived.get('ended_at', '알 수 없음')[:16]}\n"
+                        f"뽑힌 번호: {len(drawn)}/{TOTAL_NUMBERS}\n"
+                        f"참여 인원: {len(archived.get('users', {}))}명",
+            color=discord.Color.dark_gold()
+        )
+        embed.add_field(name="경품 구성", value=self._format_prize_list(event.get("prizes", [])), inline=False)
+        winner_text = "\n".join(winners[:15]) or "없음"
+        if len(winners) > 15:
+            winner_text += f"\n...외 {len(winners) - 15}건"
+        embed.add_field(name="당첨 내역", value=winner_text, inline=False)
+        await ctx.send(embed=embed)
 
-        # 꽝이 0개면 제거
-        gc["prizes"] = [p for p in prizes if p['count'] > 0]
-        gc["shuffled"] = False
-        save_config(config)
+    # --- 경품 관리 ---
 
+    @lottery_settings.command(name="경품목록")
+    @is_guild_admin()
+    async def prize_list(self, ctx):
+        """현재 경품 구성을 나열합니다."""
+        config = load_config()
+        event_name, event = self._get_active_event(config, str(ctx.guild.id))
+        if event is None:
+            await ctx.send(NO_ACTIVE_EVENT)
+            return
         embed = discord.Embed(
-            title="✅ 경품 추가 완료",
-            description=f"**{prize_name}** {count}개가 추가되었습니다.\n\n{self._format_prize_list(gc['prizes'])}",
-            color=discord.Color.green()
+            title=f"🎁 현재 경품 목록 ({self._event_label(event_name)})",
+            description=self._format_prize_list(event["prizes"]),
+            color=discord.Color.blue()
         )
         await ctx.send(embed=embed)
 
-    @lottery_settings.command(name="경품셔플")
+    def apply_prize_entries(self, guild_id: str, text: str):
+        """입력된 경품 목록을 한 번의 설정 저장으로 반영합니다.
+
+        한 줄이라도 실패하면 아무것도 저장하지 않습니다. (결과 embed, 오류 메시지)를 반환합니다.
+        """
+        entries, error = parse_prize_lines(text)
+        if error:
+            return None, f"⚠️ {error}"
+
+        with transaction():
+            config = load_config()
+            event_name, event = self._get_active_event(config, guild_id)
+            if event is None:
+                return None, NO_ACTIVE_EVENT
+            for prize_name, count in entries:
+                error = self._add_prize(event, prize_name, count)
+                if error:
+                    return None, f"⚠️ **{prize_name}** {count}개: {error} (아무것도 추가되지 않았습니다)"
+            save_config(config)
+
+        added = "\n".join(f"**{name}** {count}개" for name, count in entries)
+        embed = discord.Embed(
+            title=f"✅ 경품 추가 완료 ({self._event_label(event_name)})",
+            description=f"{added}\n\n{self._format_prize_list(event['prizes'])}",
+            color=discord.Color.green()
+        )
+        return embed, None
+
+    @lottery_settings.command(name="경품추가")
     @is_guild_admin()
-    async def prize_shuffle(self, ctx):
-        """경품 번호를 랜덤 배정합니다."""
+    async def prize_add(self, ctx, *, prize_name: str = None):
+        """입력 폼을 열어 경품을 추가합니다. 경품명을 주면 폼에 미리 채워 둡니다."""
         guild_id = str(ctx.guild.id)
-        config = load_config()
-        gc = config.setdefault(guild_id, get_guild_config(guild_id))
 
-        # 경품을 번호에 매핑
-        prize_pool = []
-        for p in gc["prizes"]:
-            prize_pool.extend([p["name"]] * p["count"])
+        # 경품명이 숫자로 끝날 수도 있으므로(예: 아이폰 15) 바로 반영하지 않고 폼에서 개수까지 확인받음
+        default = f"{prize_name} " if prize_name else None
+        view = PrizeInputView(self, ctx.author.id, guild_id, default)
+        await ctx.send("아래 버튼을 눌러 추가할 경품을 한 줄에 하나씩 `경품명 개수` 형식으로 입력해주세요.", view=view)
 
-        if len(prize_pool) != TOTAL_NUMBERS:
-            await ctx.send(f"경품 총 수가 {TOTAL_NUMBERS}개여야 합니다. 현재: {len(prize_pool)}개")
+    @lottery_settings.command(name="경품셔플")
+    @is_guild_admin()
+    async def prize_shuffle(self, ctx, mode: str = None):
+        """경품 번호를 랜덤 배정합니다. `지연`을 붙이면 뽑을 때 경품을 정합니다."""
+        if mode not in (None, "지연"):
+            await ctx.send("⚠️ 사용법: `*뽑기설정 경품셔플` 또는 `*뽑기설정 경품셔플 지연`")
             return
 
-        random.shuffle(prize_pool)
-        gc["shuffled_prizes"] = prize_pool
-        gc["shuffled"] = True
-        save_config(config)
+        error = None
+        with transaction():
+            config = load_config()
+            _, event = self._get_active_event(config, str(ctx.guild.id))
+            total = sum(p["count"] for p in event["prizes"]) if event else 0
+            if event is None:
+                error = NO_ACTIVE_EVENT
+            elif total != TOTAL_NUMBERS:
+                error = f"경품 총 수가 {TOTAL_NUMBERS}개여야 합니다. 현재: {total}개"
+            else:
+                if mode == "지연":
+                    prepare_lazy_allocation(event)
+                else:
+                    # 경품을 번호에 매핑
+                    prize_pool = []
+                    for p in event["prizes"]:
+                        prize_pool.extend([p["name"]] * p["count"])
+                    shuffle_prizes(event, prize_pool)
+                event["shuffled"] = True
+                save_config(config)
+
+        if error:
+            await ctx.send(error)
+            return
 
-        await ctx.send("🔀 경품 번호가 셔플되었습니다! 이제 뽑기판을 생성할 수 있습니다.")
+        if mode == "지연":
+            await ctx.send("🔀 지연 배정이 준비되었습니다! 번호를 뽑을 때 남은 경품 중에서 정해집니다. 이제 뽑기판을 생성할 수 있습니다.")
+        else:
+            await ctx.send("🔀 경품 번호가 셔플되었습니다! 이제 뽑기판을 생성할 수 있습니다.")
 
     @lottery_settings.command(name="경품초기화")
     @is_guild_admin()
     async def prize_reset(self, ctx):
-        """모든 뽑기 데이터를 초기화합니다. (알림채널/역할 제외)"""
+        """선택된 이벤트의 뽑기 데이터를 초기화합니다. (알림채널/역할 제외)"""
         guild_id = str(ctx.guild.id)
 
         # 설정 초기화 (알림채널, 역할, 메시지 ID 유지)
-        config = load_config()
-        gc = config.setdefault(guild_id, get_guild_config(guild_id))
-        gc["prizes"] = [{"name": "꽝", "count": 100}]
-        gc["shuffled"] = False
-        gc["shuffled_prizes"] = []
-        gc["drawn_numbers"] = {}
-        save_config(config)
-
-        # 유저 데이터 초기화
-        data = load_data()
-        if guild_id in data:
-            data[guild_id] = {}
-            save_data(data)
+        with transaction():
+            config = load_config()
+            event_name, event = self._get_active_event(config, guild_id)
+            if event is not None:
+                event["prizes"] = [dict(p) for p in DEFAULT_PRIZES]
+                event["shuffled"] = False
+                event["allocation"] = ALLOCATION_SHUFFLE
+                event["shuffled_prizes"] = []
+                event.pop("remaining_prizes", None)
+                event.pop("seed", None)
+                event["drawn_numbers"] = {}
+                save_config(config)
+
+                # 유저 데이터 초기화
+                data = load_data()
+                if event_name in data.get(guild_id, {}):
+                    data[guild_id][event_name] = {}
+                    save_data(data)
+
+        if event is None:
+            await ctx.send(NO_ACTIVE_EVENT)
+            return
 
         # 기존 뽑기판 메시지 갱신 (버튼 전부 초록색으로)
         board_cog = self.bot.get_cog("LotteryBoard")
-        if board_cog and gc.get("board_message_ids") and gc.get("board_channel_id"):
-            channel = self.bot.get_channel(gc["board_channel_id"])
+        if board_cog and event.get("board_message_ids") and event.get("board_channel_id"):
+            channel = self.bot.get_channel(event["board_channel_id"])
             if channel:
-                for idx, mid in enumerate(gc["board_message_ids"]):
+                for idx, mid in enumerate(event["board_message_ids"]):
                     try:
                         msg = await channel.fetch_message(mid)
-                        new_view = board_cog.create_board_view(guild_id, idx)
+                        new_view = board_cog.create_board_view(guild_id, event_name, idx)
                         await msg.edit(view=new_view)
                     except Exception:
                         pass
 
-        await ctx.send("🔄 모든 뽑기 데이터가 초기화되었습니다. (꽝 100개, 유저 기록 삭제)")
+        await ctx.send(f"🔄 **{self._event_label(event_name)}** 이벤트의 뽑기 데이터가 초기화되었습니다. (꽝 {TOTAL_NUMBERS}개, 유저 기록 삭제)")
 
     @lottery_settings.command(name="뽑기권부여")
     @is_guild_admin()
@@ -266,39 +472,81 @@ class LotteryConfig(commands.Cog):
         guild_id = str(ctx.guild.id)
         user_id = str(member.id)
 
-        data = load_data()
-        guild_data = data.setdefault(guild_id, {})
-        user_data = guild_data.setdefault(user_id, {
-            "tickets": 0, "total_draws": 0, "daily_claims": 0, "last_claim_date": None
-        })
-        user_data["tickets"] += count
-        save_data(data)
+        with transaction():
+            config = load_config()
+            event_name, event = self._get_active_event(config, guild_id)
+            if event is not None:
+                data = load_data()
+                user_data = get_event_user(data, guild_id, event_name, user_id)
+                user_data["tickets"] += count
+                save_data(data)
+
+        if event is None:
+            await ctx.send(NO_ACTIVE_EVENT)
+            return
 
         await ctx.send(f"🎫 {member.mention}에게 뽑기권 **{count}개**를 부여했습니다. (현재 보유: {user_data['tickets']}개)")
 
     # --- 채널/역할 설정 ---
 
+    def _format_alert_routes(self, routes: list) -> str:
+        """알림 경로 목록을 포맷팅합니다."""
+        lines = [f"<#{r['channel_id']}> — {ALERT_FILTER_LABELS[r['filter']]}" for r in routes]
+        return "\n".join(lines) or "없음"
+
     @lottery_settings.command(name="알림채널설정")
     @is_guild_admin()
-    async def set_alert_channel(self, ctx):
-        """현재 채널을 뽑기 결과 알림 채널로 설정합니다."""
+    async def set_alert_channel(self, ctx, mode: str = "전체"):
+        """현재 채널을 뽑기 결과 알림 채널로 추가합니다. 여러 채널에 동시에 보낼 수 있습니다."""
+        alert_filter = ALERT_FILTERS.get(mode)
+        if alert_filter is None:
+            await ctx.send("⚠️ 사용법: `*뽑기설정 알림채널설정` 또는 `*뽑기설정 알림채널설정 당첨`")
+            return
+
         guild_id = str(ctx.guild.id)
-        config = load_config()
-        gc = config.setdefault(guild_id, get_guild_config(guild_id))
-        gc["alert_channel_id"] = ctx.channel.id
-        save_config(config)
+        with transaction():
+            config = load_config()
+            gc = self._get_guild_config(config, guild_id)
+            routes = [r for r in gc["alert_routes"] if r["channel_id"] != ctx.channel.id]
+            routes.append({"channel_id": ctx.channel.id, "filter": alert_filter})
+            gc["alert_routes"] = routes
+            save_config(config)
+
+        await ctx.send(
+            f"📢 {ctx.channel.mention}에 {ALERT_FILTER_LABELS[alert_filter]} 알림을 보냅니다.\n\n"
+            f"**현재 알림 채널**\n{self._format_alert_routes(routes)}"
+        )
 
-        await ctx.send(f"📢 뽑기 결과 알림 채널이 {ctx.channel.mention}(으)로 설정되었습니다.")
+    @lottery_settings.command(name="알림채널해제")
+    @is_guild_admin()
+    async def remove_alert_channel(self, ctx):
+        """현재 채널을 뽑기 결과 알림 채널에서 제외합니다."""
+        guild_id = str(ctx.guild.id)
+        with transaction():
+            config = load_config()
+            gc = self._get_guild_config(config, guild_id)
+            routes = [r for r in gc["alert_routes"] if r["channel_id"] != ctx.channel.id]
+            removed = len(routes) != len(gc["alert_routes"])
+            if removed:
+                gc["alert_routes"] = routes
+                save_config(config)
+
+        if not removed:
+            await ctx.send("⚠️ 이 채널은 알림 채널이 아닙니다.")
+            return
+
+        await ctx.send(f"🔕 {ctx.channel.mention}에는 더 이상 알림을 보내지 않습니다.\n\n**현재 알림 채널**\n{self._format_alert_routes(routes)}")
 
     @lottery_settings.command(name="역할설정")
     @is_guild_admin()
     async def set_mention_role(self, ctx, role: discord.Role):
         """당첨 시 멘션할 역할을 설정합니다."""
         guild_id = str(ctx.guild.id)
-        config = load_config()
-        gc = config.setdefault(guild_id, get_guild_config(guild_id))
-        gc["mention_role_id"] = role.id
-        save_config(config)
+        with transaction():
+            config = load_config()
+            gc = self._get_guild_config(config, guild_id)
+            gc["mention_role_id"] = role.id
+            save_config(config)
 
         await ctx.send(f"🏷️ 당첨 알림 역할이 {role.mention}(으)로 설정되었습니다.")
 
@@ -310,7 +558,10 @@ class LotteryConfig(commands.Cog):
         """현재 채널에 뽑기판을 생성합니다."""
         guild_id = str(ctx.guild.id)
         config = load_config()
-        gc = config.setdefault(guild_id, get_guild_config(guild_id))
+        event_name, gc = self._get_active_event(config, guild_id)
+        if gc is None:
+            await ctx.send(NO_ACTIVE_EVENT)
+            return
 
         if not gc.get("shuffled"):
             await ctx.send("⚠️ 먼저 `*뽑기설정 경품셔플`을 실행해주세요.")
@@ -327,10 +578,6 @@ class LotteryConfig(commands.Cog):
                     except Exception:
                         pass
 
-        drawn = gc.get("drawn_numbers", {})
-        gc["board_channel_id"] = ctx.channel.id
-        gc["board_message_ids"] = []
-
         # LotteryBoard cog에서 View를 가져와서 사용
         board_cog = self.bot.get_cog("LotteryBoard")
         if not board_cog:
@@ -343,16 +590,24 @@ class LotteryConfig(commands.Cog):
 
         await ctx.send(BOARD_TITLE)
 
-        for board_idx in range(4):
-            view = board_cog.create_board_view(guild_id, board_idx)
+        message_ids = []
+        for board_idx in range(BOARD_COUNT):
+            view = board_cog.create_board_view(guild_id, event_name, board_idx)
             msg = await ctx.send(view=view)
-            gc["board_message_ids"].append(msg.id)
+            message_ids.append(msg.id)
 
             # 마지막 뽑기판 뒤에는 구분선 생략
-            if board_idx < 3:
+            if board_idx < BOARD_COUNT - 1:
                 await ctx.send(BOARD_SEPARATOR)
 
-        save_config(config)
+        # 메시지 전송 중에 들어온 뽑기 기록을 덮어쓰지 않도록 다시 읽어서 반영
+        with transaction():
+            config = load_config()
+            event = config.get(guild_id, {}).get("events", {}).get(event_name)
+            if event is not None:
+                event["board_channel_id"] = ctx.channel.id
+                event["board_message_ids"] = message_ids
+                save_config(config)
 
     @lottery_settings.command(name="메시지생성")
     @is_guild_admin()
@@ -360,7 +615,10 @@ class LotteryConfig(commands.Cog):
         """현재 채널에 뽑기권 안내 메시지를 생성합니다."""
         guild_id = str(ctx.guild.id)
         config = load_config()
-        gc = config.setdefault(guild_id, get_guild_config(guild_id))
+        event_name, gc = self._get_active_event(config, guild_id)
+        if gc is None:
+            await ctx.send(NO_ACTIVE_EVENT)
+            return
 
         # 기존 메시지 삭제 시도
         if gc.get("info_message_id") and gc.get("info_channel_id"):
@@ -382,12 +640,16 @@ class LotteryConfig(commands.Cog):
             description="아래 버튼을 눌러 뽑기권을 확인하거나 받을 수 있어...",
             color=discord.Color.purple()
         )
-        view = board_cog.create_info_view(guild_id)
+        view = board_cog.create_info_view(guild_id, event_name)
         msg = await ctx.send(embed=embed, view=view)
 
-        gc["info_channel_id"] = ctx.channel.id
-        gc["info_message_id"] = msg.id
-        save_config(config)
+        with transaction():
+            config = load_config()
+            event = config.get(guild_id, {}).get("events", {}).get(event_name)
+            if event is not None:
+                event["info_channel_id"] = ctx.channel.id
+                event["info_message_id"] = msg.id
+                save_config(config)
 
     # --- 에러 핸들러 ---
 
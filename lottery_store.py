@@ -0,0 +1,419 @@
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import random
+import secrets
+from urllib.parse import quote, unquote
+
+try:
+    import fcntl
+except ImportError:
+    # Windows 등 fcntl이 없는 환경에서는 단일 프로세스 실행만 안전합니다
+    fcntl = None
+
+# JSON 파일 경로
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(BASE_DIR, 'config', 'lottery_config.json')
+DATA_PATH = os.path.join(BASE_DIR, 'data', 'lottery_data.json')
+ARCHIVE_DIR = os.path.join(BASE_DIR, 'data', 'lottery_archive')
+SNAPSHOT_DIR = os.path.join(BASE_DIR, 'data', 'lottery_snapshots')
+LOCK_PATH = os.path.join(BASE_DIR, 'config', '.lottery.lock')
+
+TOTAL_NUMBERS = 100
+NUMBERS_PER_BOARD = 25
+BOARD_COUNT = TOTAL_NUMBERS // NUMBERS_PER_BOARD
+
+DEFAULT_EVENT = "default"
+MAX_EVENT_NAME_LENGTH = 32
+
+# 경품 배정 방식
+ALLOCATION_SHUFFLE = "shuffle"  # 번호별 경품 목록을 미리 셔플해서 저장
+ALLOCATION_LAZY = "lazy"        # 남은 경품 개수와 시드만 저장하고 뽑을 때 결정
+
+# 알림 경로 필터
+ALERT_ALL = "all"          # 모든 뽑기 결과
+ALERT_WINNERS = "winners"  # 당첨 결과만
+
+# 이벤트마다 따로 관리되는 설정 키 (이전 버전에서는 길드 설정에 바로 들어 있었음)
+EVENT_KEYS = (
+    "prizes", "shuffled", "shuffled_prizes",
+    "board_channel_id", "board_message_ids",
+    "info_channel_id", "info_message_id",
+    "drawn_numbers",
+)
+
+
+# --- 프로세스 간 잠금 ---
+
+_lock_file = None
+_lock_depth = 0
+
+
+@contextlib.contextmanager
+def transaction():
+    """설정/데이터 파일의 읽기-수정-쓰기 구간을 다른 프로세스(샤드)와 직렬화합니다.
+
+    같은 프로세스 안에서는 중첩해서 사용할 수 있습니다.
+    잠금을 쥔 채로 await하면 다른 프로세스가 멈추므로, 구간 안에서는 await하지 않습니다.
+    """
+    global _lock_file, _lock_depth
+    if _lock_depth == 0:
+        os.makedirs(os.path.dirname(LOCK_PATH), exist_ok=True)
+        _lock_file = open(LOCK_PATH, 'a')
+        if fcntl:
+            fcntl.flock(_lock_file, fcntl.LOCK_EX)
+    _lock_depth += 1
+    try:
+        yield
+    finally:
+        _lock_depth -= 1
+        if _lock_depth == 0:
+            if fcntl:
+                fcntl.flock(_lock_file, fcntl.LOCK_UN)
+            _lock_file.close()
+            _lock_file = None
+
+
+def _write_json(path: str, data):
+    """임시 파일에 쓴 뒤 교체해서, 다른 프로세스가 쓰다 만 파일을 읽지 않게 합니다."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+# --- 샤드 라우팅 ---
+
+def owns_guild(bot, guild_id) -> bool:
+    """이 프로세스가 맡은 샤드의 길드인지 확인합니다. 샤딩하지 않으면 항상 True입니다."""
+    shard_ids = getattr(bot, "shard_ids", None)
+    if shard_ids is None:
+        return True
+    shard_count = bot.shard_count or 1
+    return (int(guild_id) >> 22) % shard_count in shard_ids
+
+
+def load_config():
+    """설정 파일을 로드합니다."""
+    try:
+        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    for gc in config.values():
+        migrate_guild_config(gc)
+    return config
+
+
+def save_config(data):
+    """설정 파일을 저장합니다."""
+    _write_json(CONFIG_PATH, data)
+
+
+def load_data():
+    """데이터 파일을 로드합니다."""
+    try:
+        with open(DATA_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    for guild_id, guild_data in data.items():
+        data[guild_id] = migrate_guild_data(guild_data)
+    return data
+
+
+def save_data(data):
+    """데이터 파일을 저장합니다."""
+    _write_json(DATA_PATH, data)
+
+
+# --- 스키마 ---
+
+def new_event_config() -> dict:
+    """새 이벤트의 기본 설정을 만듭니다."""
+    return {
+        "prizes": [{"name": "꽝", "count": TOTAL_NUMBERS}],
+        "shuffled": False,
+        "allocation": ALLOCATION_SHUFFLE,
+        "shuffled_prizes": [],
+        "board_channel_id": None,
+        "board_message_ids": [],
+        "info_channel_id": None,
+        "info_message_id": None,
+        "drawn_numbers": {}
+    }
+
+
+def new_guild_config() -> dict:
+    """새 길드의 기본 설정을 만듭니다. 기본 이벤트 하나가 함께 생성됩니다."""
+    return {
+        "alert_routes": [],
+        "mention_role_id": None,
+        "active_event": DEFAULT_EVENT,
+        "events": {DEFAULT_EVENT: new_event_config()}
+    }
+
+
+def new_user_data() -> dict:
+    """새 유저의 기본 데이터를 만듭니다."""
+    return {"tickets": 0, "total_draws": 0, "daily_claims": 0, "last_claim_date": None, "draws": []}
+
+
+def migrate_guild_config(gc: dict) -> dict:
+    """이전 버전의 길드 설정을 현재 구조로 옮깁니다.
+
+    - 이벤트 구조 이전의 설정은 기본 이벤트로 옮깁니다.
+    - 알림 채널 하나(alert_channel_id)는 모든 결과를 받는 알림 경로 하나로 옮깁니다.
+    """
+    if "events" not in gc:
+        event = new_event_config()
+        for key in EVENT_KEYS:
+            if key in gc:
+                event[key] = gc.pop(key)
+        gc["events"] = {DEFAULT_EVENT: event}
+        gc.setdefault("active_event", DEFAULT_EVENT)
+
+    if "alert_routes" not in gc:
+        channel_id = gc.pop("alert_channel_id", None)
+        gc["alert_routes"] = [{"channel_id": channel_id, "filter": ALERT_ALL}] if channel_id else []
+    return gc
+
+
+def migrate_guild_data(guild_data: dict) -> dict:
+    """이벤트 구조 이전의 유저 데이터({user_id: {...}})를 기본 이벤트로 옮깁니다."""
+    if any(isinstance(v, dict) and "tickets" in v for v in guild_data.values()):
+        return {DEFAULT_EVENT: guild_data}
+    return guild_data
+
+
+def validate_event_name(name: str):
+    """이벤트 이름이 사용 가능한지 확인하고, 문제가 있으면 오류 메시지를 반환합니다."""
+    if not name or len(name) > MAX_EVENT_NAME_LENGTH:
+        return f"이벤트 이름은 1~{MAX_EVENT_NAME_LENGTH}자여야 합니다."
+    if ":" in name:
+        return "이벤트 이름에는 `:`를 사용할 수 없습니다."
+    return None
+
+
+# --- 조회 헬퍼 ---
+
+def alert_channel_ids(gc: dict, is_win: bool) -> list:
+    """뽑기 결과 알림을 받을 채널 ID 목록을 반환합니다."""
+    return [
+        route["channel_id"] for route in gc.get("alert_routes", [])
+        if route["filter"] == ALERT_ALL or (is_win and route["filter"] == ALERT_WINNERS)
+    ]
+
+
+def get_event(config: dict, guild_id: str, event_name: str):
+    """진행 중인 이벤트 설정을 가져옵니다. 없으면 None을 반환합니다."""
+    gc = config.get(guild_id)
+    if not gc:
+        return None
+    return gc.get("events", {}).get(event_name)
+
+
+def get_event_users(data: dict, guild_id: str, event_name: str) -> dict:
+    """이벤트의 유저 데이터 묶음을 가져오거나 초기화합니다."""
+    return data.setdefault(guild_id, {}).setdefault(event_name, {})
+
+
+def get_event_user(data: dict, guild_id: str, event_name: str, user_id: str) -> dict:
+    """이벤트의 특정 유저 데이터를 가져오거나 초기화합니다."""
+    return get_event_users(data, guild_id, event_name).setdefault(user_id, new_user_data())
+
+
+# --- 유저별 뽑기 기록 ---
+
+def record_user_draw(user_data: dict, number: int, prize: str):
+    """유저의 뽑기 기록에 번호와 경품을 추가합니다."""
+    user_data.setdefault("draws", []).append({"number": number, "prize": prize})
+
+
+def ensure_draw_index(user_data: dict, event: dict, user_id: str) -> bool:
+    """기록 목록이 없는 이전 버전 유저는 drawn_numbers를 한 번만 훑어서 채웁니다.
+
+    새로 채웠으면 True를 반환합니다. 이후 조회는 유저 본인의 뽑기 횟수에만 비례합니다.
+    """
+    if "draws" in user_data:
+        return False
+    drawn = event.get("drawn_numbers", {}) if event else {}
+    user_data["draws"] = [
+        {"number": int(num), "prize": record.get("prize", "꽝")}
+        for num, record in sorted(drawn.items(), key=lambda item: int(item[0]))
+        if record.get("user_id") == user_id
+    ]
+    return True
+
+
+# --- 경품 배정 ---
+
+def shuffle_prizes(event: dict, prize_pool: list):
+    """번호별 경품 목록 전체를 셔플해서 저장합니다."""
+    random.shuffle(prize_pool)
+    event["allocation"] = ALLOCATION_SHUFFLE
+    event["shuffled_prizes"] = prize_pool
+    event.pop("remaining_prizes", None)
+    event.pop("seed", None)
+
+
+def prepare_lazy_allocation(event: dict):
+    """경품 개수와 시드만 저장합니다. 저장 크기가 경품 종류 수에만 비례합니다."""
+    event["allocation"] = ALLOCATION_LAZY
+    event["shuffled_prizes"] = []
+    event["remaining_prizes"] = {p["name"]: p["count"] for p in event["prizes"] if p["count"] > 0}
+    event["seed"] = secrets.randbits(64)
+
+
+def draw_prize(event: dict, number: int) -> str:
+    """번호의 경품을 결정합니다. 지연 배정에서는 남은 경품을 차감합니다.
+
+    지연 배정은 매 뽑기마다 남은 개수에 비례해 경품을 고르므로,
+    전체를 셔플해 두고 뽑은 순서대로 공개하는 것과 같은 분포를 가집니다.
+    """
+    if event.get("allocation") != ALLOCATION_LAZY:
+        shuffled = event.get("shuffled_prizes", [])
+        return shuffled[number - 1] if number - 1 < len(shuffled) else "꽝"
+
+    remaining = event.get("remaining_prizes", {})
+    total = sum(remaining.values())
+    if total <= 0:
+        return "꽝"
+
+    # 시드와 뽑기 순서로 난수를 고정해 결과를 나중에 재현할 수 있게 함
+    rng = random.Random(f"{event['seed']}:{len(event.get('drawn_numbers', {}))}")
+    pick = rng.randrange(total)
+    for name, count in remaining.items():
+        if pick < count:
+            remaining[name] = count - 1
+            return name
+        pick -= count
+    return "꽝"
+
+
+# --- custom_id ---
+
+def board_custom_id(guild_id: str, event_name: str, number: int) -> str:
+    """뽑기판 번호 버튼의 custom_id. 기본 이벤트는 이미 게시된 뽑기판을 위해 이전 형식을 유지합니다."""
+    if event_name == DEFAULT_EVENT:
+        return f"lottery_number:{guild_id}:{number}"
+    return f"lottery_number:{guild_id}:{event_name}:{number}"
+
+
+def info_custom_id(action: str, event_name: str) -> str:
+    """안내 메시지 버튼의 custom_id. 기본 이벤트는 이전 형식을 유지합니다."""
+    if event_name == DEFAULT_EVENT:
+        return f"lottery_{action}"
+    return f"lottery_{action}:{event_name}"
+
+
+# --- 아카이브 ---
+
+def _archive_path(guild_id: str, event_name: str) -> str:
+    return os.path.join(ARCHIVE_DIR, guild_id, f"{quote(event_name, safe='')}.json.gz")
+
+
+def archive_event(guild_id: str, event_name: str, event_config: dict, event_users: dict, ended_at: str):
+    """종료된 이벤트를 압축 아카이브로 옮깁니다."""
+    path = _archive_path(guild_id, event_name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = {
+        "name": event_name,
+        "ended_at": ended_at,
+        "config": event_config,
+        "users": event_users
+    }
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False)
+
+
+def load_archived_event(guild_id: str, event_name: str):
+    """아카이브된 이벤트를 로드합니다. 없으면 None을 반환합니다."""
+    try:
+        with gzip.open(_archive_path(guild_id, event_name), 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+
+
+def list_archived_events(guild_id: str) -> list:
+    """아카이브된 이벤트 이름 목록을 반환합니다."""
+    guild_dir = os.path.join(ARCHIVE_DIR, guild_id)
+    if not os.path.isdir(guild_dir):
+        return []
+    return sorted(
+        unquote(f[:-len(".json.gz")])
+        for f in os.listdir(guild_dir) if f.endswith(".json.gz")
+    )
+
+
+# --- 스냅샷 ---
+# 스냅샷 하나는 직전 스냅샷 이후 바뀐 길드만 담습니다: {"taken_at", "guilds": {guild_id: {"config", "data"} 또는 None}}
+# None은 그 시점에 길드 기록이 없었다는 뜻입니다.
+
+SNAPSHOT_ID_FORMAT = "%Y%m%d-%H%M%S"
+
+
+def _snapshot_path(snapshot_id: str) -> str:
+    return os.path.join(SNAPSHOT_DIR, f"{snapshot_id}.json.gz")
+
+
+def guild_digest(entry) -> str:
+    """길드 스냅샷 항목의 해시. 바뀐 길드를 골라낼 때 사용합니다."""
+    raw = json.dumps(entry, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def write_snapshot(snapshot_id: str, taken_at: str, guilds: dict):
+    """스냅샷 파일을 씁니다. 임시 파일에 쓴 뒤 교체하므로 쓰다 만 스냅샷은 남지 않습니다."""
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    path = _snapshot_path(snapshot_id)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        json.dump({"taken_at": taken_at, "guilds": guilds}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(snapshot_id: str):
+    """스냅샷을 로드합니다. 없으면 None을 반환합니다."""
+    try:
+        with gzip.open(_snapshot_path(snapshot_id), 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+
+
+def delete_snapshot(snapshot_id: str):
+    """스냅샷 파일을 삭제합니다."""
+    try:
+        os.remove(_snapshot_path(snapshot_id))
+    except FileNotFoundError:
+        pass
+
+
+def list_snapshots() -> list:
+    """스냅샷 ID를 오래된 순으로 반환합니다."""
+    if not os.path.isdir(SNAPSHOT_DIR):
+        return []
+    return sorted(f[:-len(".json.gz")] for f in os.listdir(SNAPSHOT_DIR) if f.endswith(".json.gz"))
+
+
+def find_guild_snapshot(guild_id: str, snapshot_id: str):
+    """snapshot_id 시점의 길드 상태를 찾습니다.
+
+    그 시점 이전에 길드가 마지막으로 기록된 스냅샷의 항목을 반환하고,
+    한 번도 기록된 적이 없으면 (None, None)을 반환합니다.
+    """
+    for sid in reversed([s for s in list_snapshots() if s <= snapshot_id]):
+        snapshot = load_snapshot(sid)
+        if snapshot and guild_id in snapshot["guilds"]:
+            return sid, snapshot["guilds"][guild_id]
+    return None, None
+
+
+def list_guild_snapshots(guild_id: str) -> list:
+    """길드가 기록된(바뀐) 스냅샷 ID를 오래된 순으로 반환합니다."""
+    return [sid for sid in list_snapshots() if guild_id in (load_snapshot(sid) or {}).get("guilds", {})]
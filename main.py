@@ -1,8 +1,29 @@
+import time
+STARTUP_T0 = time.perf_counter()
+
 import discord
 from discord.ext import commands
 import os
 import asyncio
+import signal
+import traceback
 import typing
+
+import monitor_utils
+
+# 시작 단계별 소요 시간 [(단계, 초)]
+startup_phases = []
+_phase_start = STARTUP_T0
+
+def end_phase(name: str):
+    """직전 단계가 끝난 시점부터 지금까지를 한 단계로 기록합니다."""
+    global _phase_start
+    now = time.perf_counter()
+    startup_phases.append((name, now - _phase_start))
+    _phase_start = now
+
+end_phase("imports")
+
 try:
     from dotenv import dotenv_values
     _env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
@@ -11,6 +32,7 @@ try:
 except Exception as e:
     print(f"⚠️ .env 로드 실패: {e}")
     _env = {}
+end_phase(".env")
 
 def get_env(key):
     """환경 변수를 가져옵니다. .env 파일 값을 우선하고, 없으면 시스템 환경 변수에서 가져옵니다."""
@@ -22,15 +44,38 @@ def get_env(key):
 application_id = get_env("APPLICATION_ID")
 
 intents = discord.Intents.all()
-bot = commands.Bot(command_prefix="*", intents=intents, help_command=None, application_id = application_id)
+
+# 샤딩 설정
+# SHARD_COUNT만 지정하면 한 프로세스가 모든 샤드를 실행하고,
+# SHARD_IDS(쉼표 구분)까지 지정하면 여러 프로세스가 샤드를 나눠 맡습니다.
+shard_count = get_env("SHARD_COUNT")
+shard_ids = get_env("SHARD_IDS")
+
+if shard_count:
+    bot = commands.AutoShardedBot(
+        command_prefix="*", intents=intents, help_command=None, application_id = application_id,
+        shard_count=int(shard_count),
+        shard_ids=[int(i) for i in shard_ids.split(",")] if shard_ids else None
+    )
+else:
+    bot = commands.Bot(command_prefix="*", intents=intents, help_command=None, application_id = application_id)
 bot_token = get_env("DISCORD_BOT_TOKEN")
 
+# 종료 시 각 단계의 제한 시간 (초)
+DRAIN_CALLBACK_TIMEOUT = 15
+DRAIN_QUEUE_TIMEOUT = 15
+bot.draining = False
+
 # load cogs
 
+# 처음 사용할 때 로드하는 cog -> 로드를 트리거하는 명령어 이름
+LAZY_COGS = {"LotteryConfig": ["뽑기설정"]}
+
 async def load():
     success = []
     fail = []
     why = {}
+    timings = {}
 
     cogs_path = os.path.join(os.path.dirname(__file__), "cogs")
 
@@ -43,6 +88,11 @@ async def load():
     for filename in ordered:
         if filename.endswith(".py") and not filename.startswith("__"):
             cog_name = f"cogs.{filename[:-3]}"
+            if filename[:-3] in LAZY_COGS:
+                register_lazy_cog(filename[:-3], LAZY_COGS[filename[:-3]])
+                print(f"💤 {cog_name} 는 처음 사용할 때 로드합니다")
+                continue
+            start = time.perf_counter()
             try:
                 await bot.load_extension(cog_name)
                 success.append(cog_name)
@@ -51,6 +101,7 @@ async def load():
                 print(f"❌ {cog_name} 로드 실패: {e}")
                 fail.append(cog_name)
                 why[cog_name] = e
+            timings[cog_name] = time.perf_counter() - start
 
     logger = bot.get_cog('Logger')
 
@@ -61,27 +112,139 @@ async def load():
         await logger.log("모든 cog가 로드되었습니다.", "main.py")
     else:
         print("⚠️ Logger cog가 로드되지 않았습니다.")
+    return timings
+
+def register_lazy_cog(cog: str, command_names: list):
+    """cog 대신 가벼운 자리표시 명령어를 등록합니다.
+
+    자리표시 명령어가 처음 호출되면 자신을 지우고 실제 cog를 로드한 뒤 같은 메시지를 다시 처리합니다.
+    """
+    async def load_on_first_use(ctx, *, _args: str = None):
+        cog_name = f"cogs.{cog}"
+        for name in command_names:
+            bot.remove_command(name)
+        start = time.perf_counter()
+        try:
+            await bot.load_extension(cog_name)
+        except Exception as e:
+            # 다음 호출에서 다시 시도할 수 있도록 자리표시 명령어 복구
+            register_lazy_cog(cog, command_names)
+            print(f"❌ {cog_name} 지연 로드 실패: {e}")
+            if logger := bot.get_cog('Logger'):
+                await logger.log(f"{cog_name} cog가 로드에 실패하였습니다. 오류: {e}", cog_name)
+            return
+        print(f"✅ {cog_name} 지연 로드 완료 ({time.perf_counter() - start:.2f}초)")
+        await bot.invoke(await bot.get_context(ctx.message))
+
+    for name in command_names:
+        bot.add_command(commands.Command(load_on_first_use, name=name, hidden=True))
+
+def format_startup_report(timings: dict) -> str:
+    phases = " / ".join(f"{name} {seconds:.2f}초" for name, seconds in startup_phases)
+    total = sum(seconds for _, seconds in startup_phases)
+    slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:3]
+    cogs = ", ".join(f"{name[5:]} {seconds:.2f}초" for name, seconds in slowest)
+    return f"⏱️ 시작 단계: {phases} — 총 {total:.2f}초 (cog: {cogs or '없음'})"
+
+# graceful shutdown
+
+@bot.check
+async def reject_while_draining(ctx):
+    """종료 중에는 새 명령어를 받지 않습니다."""
+    return not bot.draining
+
+# 진행 중인 명령어도 콜백과 함께 종료 대기 대상에 포함
+# (before_invoke/after_invoke 훅은 LoopMonitor가 쓰므로 이벤트로 셈)
+# 검사에서 거부된 명령어도 on_command와 on_command_error가 한 번씩 호출되므로 수가 맞음
+@bot.listen('on_command')
+async def count_command_start(ctx):
+    monitor_utils.in_flight += 1
+
+@bot.listen('on_command_completion')
+async def count_command_done(ctx):
+    monitor_utils.in_flight -= 1
+
+@bot.listen('on_command_error')
+async def count_command_failed(ctx, error):
+    """명령어 수를 줄이고, 처리기가 없는 명령어의 오류를 기록합니다.
+
+    on_command_error 리스너가 하나라도 있으면 discord.py 기본 처리기가 오류를 기록하지 않으므로 여기서 대신 남깁니다.
+    """
+    if ctx.command is not None:
+        monitor_utils.in_flight -= 1
+    if ctx.command and ctx.command.has_error_handler():
+        return
+    if ctx.cog and ctx.cog.has_error_handler():
+        return
+
+    print(f"명령어 {ctx.command} 오류:")
+    traceback.print_exception(type(error), error, error.__traceback__)
+    if ctx.command is not None:
+        if logger := bot.get_cog('Logger'):
+            await logger.log(f"명령어 {ctx.command} 오류: {error}", "main.py")
+
+async def shutdown(reason: str):
+    """새 상호작용을 막고, 진행 중인 작업과 큐를 비운 뒤 게이트웨이를 닫습니다."""
+    if bot.draining:
+        return
+    bot.draining = True
+    print(f"🛑 종료 시작 ({reason}): 새 상호작용을 받지 않습니다.")
+
+    # 진행 중인 뽑기 콜백과 명령어 마무리 (파일 저장은 콜백 안에서 동기로 끝나므로 중간에 끊기지 않음)
+    if not await monitor_utils.wait_idle(DRAIN_CALLBACK_TIMEOUT):
+        print(f"⚠️ 진행 중인 콜백/명령어 {monitor_utils.in_flight}개가 제한 시간 안에 끝나지 않았습니다.")
+
+    # 뽑기판 갱신/알림 큐 비우기
+    if board_cog := bot.get_cog('LotteryBoard'):
+        if not await board_cog.drain(DRAIN_QUEUE_TIMEOUT):
+            print("⚠️ 뽑기판 갱신/알림 큐를 모두 비우지 못했습니다.")
+        await board_cog.webhooks.close()
+
+    # 쌓인 로그 전송
+    if monitor := bot.get_cog('LoopMonitor'):
+        await monitor.flush_report()
+    if logger := bot.get_cog('Logger'):
+        await logger.log(f"봇을 종료합니다. ({reason})", "main.py")
+
+    await bot.close()
+
+def on_signal(sig: signal.Signals):
+    # 태스크가 가비지 컬렉션되지 않도록 bot에 보관
+    bot.shutdown_task = asyncio.create_task(shutdown(sig.name))
 
 # server start
 
 async def main():
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, on_signal, sig)
+        except NotImplementedError:
+            # Windows에서는 시그널 핸들러를 등록할 수 없음
+            pass
+
+    end_phase("setup")
     async with bot:
         await bot.start(bot_token)
 
-# bot ready
+# startup
 
-@bot.event
-async def on_ready():
-    await load()
+cog_timings = {}
 
-    if logger := bot.get_cog('Logger'):
-        await logger.log("봇이 성공적으로 시작되었습니다.", "main.py")
+async def setup_hook():
+    """로그인 직후, 게이트웨이 연결 전에 cog와 Persistent View를 등록합니다.
 
-    print("Online!")
+    연결되자마자 들어오는 상호작용도 바로 처리할 수 있습니다.
+    """
+    end_phase("login")
+    cog_timings.update(await load())
+    end_phase("cogs/views")
 
-    activity = discord.CustomActivity(name="👻 흐엥… 나 무서운 유령이야")
-    await bot.change_presence(status=discord.Status.online, activity=activity)
+bot.setup_hook = setup_hook
 
+async def sync_all_guilds():
+    """길드별 명령어 동기화. 시작을 막지 않도록 백그라운드에서 실행합니다."""
+    start = time.perf_counter()
     print("Syncing commands to all guilds...")
     for guild in bot.guilds:
         try:
@@ -94,6 +257,39 @@ async def on_ready():
             print(f"Synced to {guild.name} ({guild.id})")
         except Exception as e:
             print(f"Failed to sync to {guild.name}: {e}")
+
+    message = f"⏱️ 명령어 동기화 완료: 길드 {len(bot.guilds)}개, {time.perf_counter() - start:.2f}초"
+    print(message)
+    if logger := bot.get_cog('Logger'):
+        await logger.log(message, "main.py")
+
+@bot.listen('on_interaction')
+async def record_first_interaction(interaction):
+    if getattr(bot, "first_interaction_at", None) is None:
+        bot.first_interaction_at = time.perf_counter()
+        print(f"⏱️ 시작 후 첫 상호작용까지 {bot.first_interaction_at - STARTUP_T0:.2f}초")
+
+# bot ready
+
+@bot.event
+async def on_ready():
+    # 재연결 시에도 on_ready가 다시 호출되므로 시작 작업은 한 번만 실행
+    if getattr(bot, "sync_task", None) is not None:
+        return
+    end_phase("gateway")
+
+    report = format_startup_report(cog_timings)
+    print(report)
+    if logger := bot.get_cog('Logger'):
+        await logger.log("봇이 성공적으로 시작되었습니다.", "main.py")
+        await logger.log(report, "main.py")
+
+    print("Online!")
+
+    activity = discord.CustomActivity(name="👻 흐엥… 나 무서운 유령이야")
+    await bot.change_presence(status=discord.Status.online, activity=activity)
+
+    bot.sync_task = asyncio.create_task(sync_all_guilds())
     
  # slash command sync
 
@@ -135,4 +331,25 @@ async def sync(
 async def sync_error(error):
     print(f"error in sync: {error}")
 
+# cog hot reload
+
+@bot.command(name="리로드")
+@commands.is_owner()
+async def reload(ctx: commands.Context, cog: str) -> None:
+    """cog를 다시 로드합니다. 진행 중인 상태는 cog_unload/cog_load에서 새 인스턴스로 넘겨집니다."""
+    cog_name = f"cogs.{cog}"
+    try:
+        await bot.reload_extension(cog_name)
+    except commands.ExtensionNotLoaded:
+        await ctx.send(f"❌ {cog_name}은(는) 로드되어 있지 않습니다.")
+        return
+    except Exception as e:
+        # reload_extension은 실패 시 이전 모듈로 되돌립니다
+        await ctx.send(f"❌ {cog_name} 재로드 실패 (이전 버전 유지): {e}")
+        return
+
+    await ctx.send(f"🔁 {cog_name} 재로드 완료")
+    if logger := bot.get_cog('Logger'):
+        await logger.log(f"{cog_name} cog가 재로드되었습니다.", "main.py")
+
 asyncio.run(main())
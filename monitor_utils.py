@@ -0,0 +1,48 @@
+import asyncio
+import functools
+
+SHUTTING_DOWN = "🔧 봇이 곧 재시작됩니다. 잠시 후 다시 시도해주세요."
+
+# 실행 중인 콜백 수 (종료 시 이 값이 0이 될 때까지 기다림)
+in_flight = 0
+
+
+def timed_callback(name=None):
+    """
+    View/Button 콜백의 실행 시간을 LoopMonitor cog에 기록하는 데코레이터입니다.
+    ui.button 등과 함께 쓸 때는 가장 안쪽(함수 바로 위)에 붙입니다.
+    LoopMonitor가 로드되지 않았으면 시간은 기록하지 않습니다.
+    봇이 종료 중(bot.draining)이면 콜백을 실행하지 않고 안내 메시지만 보냅니다.
+    """
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(self, interaction, *args, **kwargs):
+            global in_flight
+            if getattr(interaction.client, "draining", False):
+                await interaction.response.send_message(SHUTTING_DOWN, ephemeral=True)
+                return
+
+            in_flight += 1
+            try:
+                monitor = interaction.client.get_cog('LoopMonitor')
+                if monitor is None:
+                    return await func(self, interaction, *args, **kwargs)
+                with monitor.track(label):
+                    return await func(self, interaction, *args, **kwargs)
+            finally:
+                in_flight -= 1
+        return wrapper
+    return decorator
+
+
+async def wait_idle(timeout: float) -> bool:
+    """실행 중인 콜백이 모두 끝날 때까지 기다립니다. 제한 시간 안에 끝나면 True를 반환합니다."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while in_flight > 0:
+        if loop.time() >= deadline:
+            return False
+        await asyncio.sleep(0.05)
+    return True
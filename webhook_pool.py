@@ -0,0 +1,78 @@
+import aiohttp
+import discord
+
+WEBHOOK_NAME = "하령 뽑기 알림"
+
+
+class WebhookPool:
+    """
+    채널별 웹훅을 재사용해서 메시지를 보내는 풀입니다.
+    웹훅 요청은 봇과 별도의 HTTP 세션과 레이트 리밋(웹훅마다)을 사용하므로,
+    알림이 많아도 같은 채널의 뽑기판 수정 요청 한도를 나눠 쓰지 않습니다.
+    웹훅을 만들 권한이 없는 채널은 봇 계정으로 직접 보냅니다.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.session = None
+        self.webhooks = {}  # channel_id -> discord.Webhook (권한이 없으면 None)
+
+    async def start(self):
+        self.session = aiohttp.ClientSession()
+
+    async def close(self):
+        if self.session:
+            await self.session.close()
+            self.session = None
+        self.webhooks.clear()
+
+    async def _get_webhook(self, channel):
+        """채널의 봇 웹훅을 찾거나 새로 만듭니다. 권한이 없거나 만들 수 없으면 None을 반환합니다."""
+        if channel.id in self.webhooks:
+            return self.webhooks[channel.id]
+
+        webhook = None
+        try:
+            existing = await channel.webhooks()
+            hook = next((h for h in existing if h.token and h.user and h.user.id == self.bot.user.id), None)
+            if hook is None:
+                hook = await channel.create_webhook(name=WEBHOOK_NAME)
+            webhook = discord.Webhook.partial(hook.id, hook.token, session=self.session)
+        except (discord.Forbidden, AttributeError):
+            # Manage Webhooks 권한이 없거나 웹훅을 지원하지 않는 채널
+            pass
+        except discord.HTTPException as e:
+            # 채널의 웹훅 수 한도 등으로 만들 수 없으면 이 채널은 봇 계정으로 보냄
+            print(f"채널 {channel.id}의 웹훅을 준비하지 못해 봇 계정으로 보냅니다: {e}")
+        self.webhooks[channel.id] = webhook
+        return webhook
+
+    async def send(self, channel_id: int, content: str = None, embed: discord.Embed = None):
+        """채널에 메시지를 보냅니다. 채널을 찾을 수 없으면 False를 반환합니다."""
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            return False
+
+        webhook = await self._get_webhook(channel)
+        if webhook is None:
+            await channel.send(content=content, embed=embed)
+            return True
+
+        me = getattr(channel.guild, "me", None) or self.bot.user
+        kwargs = {
+            "content": content or discord.utils.MISSING,
+            "embed": embed or discord.utils.MISSING,
+            "username": me.display_name,
+            "avatar_url": me.display_avatar.url,
+        }
+        try:
+            await webhook.send(**kwargs)
+        except discord.NotFound:
+            # 웹훅이 삭제되었으면 한 번만 다시 만들어서 전송
+            self.webhooks.pop(channel.id, None)
+            webhook = await self._get_webhook(channel)
+            if webhook is None:
+                await channel.send(content=content, embed=embed)
+            else:
+                await webhook.send(**kwargs)
+        return True